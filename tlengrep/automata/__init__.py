@@ -1,3 +1,4 @@
 from automata.af import AF
 from automata.afd import AFD
 from automata.afnd import AFND
+from automata.ranges import CharSet
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from tabulate import tabulate
 from typing import Hashable
 
+from automata.ranges import label_key
+
 
 __all__ = ["AF"]
 
@@ -81,15 +83,44 @@ class AF(ABC):
 
         return self
 
-    def transitions_table(self):
-        """Genera una tabla con las transiciones del autómata."""
+    def alphabet_classes(self) -> list[list[str]]:
+        """
+        Agrupa el alfabeto en clases de equivalencia: dos caracteres están en
+        la misma clase si tienen las mismas transiciones desde todos los
+        estados. Las clases (y los caracteres de cada clase) están ordenadas.
+        Los CharSet del alfabeto se agrupan igual que los caracteres.
+        """
+        classes = {}
+        states = list(self.transitions)
+        for char in sorted(self.alphabet, key=label_key):
+            signature = []
+            for state in states:
+                destination = self.transitions[state].get(char)
+                signature.append(frozenset(destination) if isinstance(destination, set) else destination)
+            classes.setdefault(tuple(signature), []).append(char)
+        return list(classes.values())
+
+    def transitions_table(self, classes: bool = False):
+        """
+        Genera una tabla con las transiciones del autómata. Si classes es
+        verdadero, los caracteres de una misma clase de equivalencia (ver
+        alphabet_classes) comparten una única columna.
+        """
+
+        columns = self._get_extended_alphabet()
+        labels = columns
+        if classes:
+            representatives = {chars[0]: ",".join(map(str, chars)) for chars in self.alphabet_classes()}
+            columns = [char for char in columns if char in representatives or char not in self.alphabet]
+            labels = [representatives.get(char, char) for char in columns]
 
-        header = ["Estado"] + self._get_extended_alphabet()
+        header = ["Estado"] + labels
         table = []
         for state in self.transitions:
             row = [
                 f"{state}{'*' if state in self.final_states else ('^' if state == self.initial_state else '')}"]
-            row.extend(self._transitions_to_str(state).values())
+            transitions = self._transitions_to_str(state)
+            row.extend(transitions[char] for char in columns)
             table.append(row)
         return tabulate(table, header, tablefmt="fancy_grid")
 
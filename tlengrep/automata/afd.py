@@ -1,5 +1,6 @@
-from typing import Hashable
+from typing import Hashable, Union
 from automata.af import AF
+from automata.ranges import CharSet, label_key
 
 __all__ = ["AFD"]
 
@@ -7,8 +8,12 @@ __all__ = ["AFD"]
 class AFD(AF):
     """Autómata finito determinístico."""
 
-    def add_transition(self, state1: Hashable, state2: Hashable, char: str):
-        """Agrega una transición al autómata."""
+    def add_transition(self, state1: Hashable, state2: Hashable, char: Union[str, CharSet]):
+        """
+        Agrega una transición al autómata, por un carácter o por cualquier
+        carácter de un CharSet (las etiquetas de un mismo estado deben ser
+        disjuntas).
+        """
         if state1 not in self.states:
             raise ValueError(f"El estado {state1} no pertenece al autómata.")
         if state2 not in self.states:
@@ -17,8 +22,80 @@ class AFD(AF):
         self.alphabet.add(char)
 
     def minimize(self):
-        """Minimiza el autómata."""
-        raise NotImplementedError
+        """
+        Minimiza el autómata por refinamiento de particiones (algoritmo de
+        Moore). Devuelve un AFD nuevo, con estados q0 (inicial), q1, q2, ...;
+        solo se consideran los estados alcanzables desde el inicial.
+        """
+        alphabet = sorted(self.alphabet, key=label_key)
+        reachable = self._reachable_states()
+
+        # Partición inicial: finales y no finales
+        classes = {state: int(state in self.final_states) for state in reachable}
+        while True:
+            signatures = {}
+            new_classes = {}
+            for state in reachable:
+                signature = (classes[state],) + tuple(
+                    classes.get(self.transitions[state].get(char), -1) for char in alphabet)
+                new_classes[state] = signatures.setdefault(signature, len(signatures))
+            if len(signatures) == len(set(classes.values())):
+                break
+            classes = new_classes
+
+        # Nombramos las clases en orden de descubrimiento desde el inicial
+        names = {}
+        states_to_visit = [self.initial_state]
+        while len(states_to_visit) > 0:
+            state = states_to_visit.pop(0)
+            if classes[state] in names:
+                continue
+            names[classes[state]] = f"q{len(names)}"
+            for char in alphabet:
+                if char in self.transitions[state]:
+                    states_to_visit.append(self.transitions[state][char])
+
+        afd = AFD()
+        for state in reachable:
+            if names[classes[state]] not in afd.states:
+                afd.add_state(names[classes[state]], state in self.final_states)
+        afd.mark_initial_state("q0")
+        for state in reachable:
+            for char, next_state in self.transitions[state].items():
+                afd.add_transition(names[classes[state]], names[classes[next_state]], char)
+        return afd
+
+    def dead_states(self) -> set:
+        """
+        Devuelve los estados muertos del autómata: aquellos desde los que no se
+        puede alcanzar ningún estado final.
+        """
+        predecessors = {state: set() for state in self.states}
+        for state in self.transitions:
+            for next_state in self.transitions[state].values():
+                predecessors[next_state].add(state)
+
+        alive = set(self.final_states)
+        states_to_visit = list(self.final_states)
+        while len(states_to_visit) > 0:
+            state = states_to_visit.pop()
+            for previous_state in predecessors[state]:
+                if previous_state not in alive:
+                    alive.add(previous_state)
+                    states_to_visit.append(previous_state)
+        return self.states - alive
+
+    def _reachable_states(self) -> set:
+        """Devuelve los estados alcanzables desde el estado inicial."""
+        reachable = {self.initial_state}
+        states_to_visit = [self.initial_state]
+        while len(states_to_visit) > 0:
+            state = states_to_visit.pop()
+            for next_state in self.transitions[state].values():
+                if next_state not in reachable:
+                    reachable.add(next_state)
+                    states_to_visit.append(next_state)
+        return reachable
 
     def _rename_state_in_transitions(self, old_name: Hashable, new_name: Hashable):
         """Renombra un estado dentro de las transiciones del autómata."""
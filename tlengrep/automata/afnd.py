@@ -3,6 +3,7 @@ from typing import Hashable, Union
 
 from automata.af import AF
 from automata.afd import AFD
+from automata.ranges import CharSet, minterms
 
 
 __all__ = ["AFND"]
@@ -15,8 +16,11 @@ class SpecialSymbol(Enum):
 class AFND(AF):
     """Autómata finito no determinístico (con transiciones lambda)."""
 
-    def add_transition(self, state1: Hashable, state2: Hashable, char: Union[str, SpecialSymbol]):
-        """Agrega una transición al autómata."""
+    def add_transition(self, state1: Hashable, state2: Hashable, char: Union[str, CharSet, SpecialSymbol]):
+        """
+        Agrega una transición al autómata, por un carácter, por cualquier
+        carácter de un CharSet o por λ.
+        """
         if state1 not in self.states:
             raise ValueError(f"El estado {state1} no pertenece al autómata.")
         if state2 not in self.states:
@@ -27,39 +31,86 @@ class AFND(AF):
         if char is not SpecialSymbol.Lambda:
             self.alphabet.add(char)
 
-    def determinize(self) -> AFD:
-        """Determiniza el autómata."""
-
-        states_to_visit = {self.initial_state}
-        visited_states = set()
-        
-        old_transitions = self.transitions
-        old_states = self.states
-        old_finals = self.final_states
-
-        self.transitions = dict()
-        self.states = set()
-        self.final_states = set()
-
-        while len(states_to_visit) > 0: 
-            current_state = states_to_visit.pop()
-            
-            for symb in self.alphabet: 
-                new_state = self.mover(current_state, symb)
-                states_to_visit.add(visited_states.difference(new_state))
-                #TO DO: sort estados- no los estoy pasando a strings aun 
-                self.add_state(new_state, any(lambda state: state in old_finals, new_state.keys()))
-                self.add_transition(current_state, new_state, symb)
-
-            visited_states.add(current_state)
-        
-        return self
-    
-    def mover(self, estado_desde, symb_cons):
-    
-        estados_alcanzables = dict(filter( 
-            lambda state_from, symb_states : state_from == estado_desde , self.transitions.items()))
-        return set(filter(lambda symbol, state_to: symbol == symb_cons, estados_alcanzables.items()))
+    def determinize(self, search: bool = False) -> AFD:
+        """
+        Determiniza el autómata (construcción de subconjuntos). Devuelve un AFD
+        nuevo y completo, con estados q0 (inicial), q1, q2, ... en orden de
+        descubrimiento; el conjunto vacío, si es alcanzable, es el estado trampa.
+
+        Si search es True, construye en cambio el AFD del lenguaje Σ*L, que
+        acepta las cadenas con algún sufijo en L: a cada conjunto alcanzado se
+        le vuelve a agregar la clausura del estado inicial.
+
+        Si hay transiciones por CharSet, el alfabeto se parte en mintérminos
+        (ver automata.ranges.minterms) y el AFD tiene una transición por
+        mintérmino, en lugar de una por carácter.
+        """
+        alphabet = minterms(self.alphabet)
+        initial_state = self.lambda_closure({self.initial_state})
+        names = {initial_state: "q0"}
+
+        afd = AFD()
+        afd.add_state("q0", not initial_state.isdisjoint(self.final_states))
+        afd.mark_initial_state("q0")
+
+        states_to_visit = [initial_state]
+        while len(states_to_visit) > 0:
+            current_state = states_to_visit.pop(0)
+            for symb, labels in alphabet:
+                new_state = self.lambda_closure(frozenset().union(*(self.mover(current_state, label)
+                                                                    for label in labels)))
+                if search:
+                    new_state |= initial_state
+                if new_state not in names:
+                    names[new_state] = f"q{len(names)}"
+                    afd.add_state(names[new_state], not new_state.isdisjoint(self.final_states))
+                    states_to_visit.append(new_state)
+                afd.add_transition(names[current_state], names[new_state], symb)
+
+        return afd
+
+    def reverse(self) -> "AFND":
+        """
+        Devuelve un AFND nuevo que acepta las cadenas aceptadas por este, pero
+        invertidas: se invierten todas las transiciones, el inicial pasa a
+        ser el único estado final y un estado inicial nuevo va por λ a los
+        que eran finales.
+        """
+        initial_state = "qr"
+        while initial_state in self.states:
+            initial_state += "'"
+
+        afnd = AFND()
+        for state in self.states:
+            afnd.add_state(state, state == self.initial_state)
+        afnd.add_state(initial_state)
+        afnd.mark_initial_state(initial_state)
+        for state in self.final_states:
+            afnd.add_transition(initial_state, state, SpecialSymbol.Lambda)
+        for state, transitions in self.transitions.items():
+            for char, destinations in transitions.items():
+                for destination in destinations:
+                    afnd.add_transition(destination, state, char)
+        return afnd
+
+    def mover(self, estados_desde: frozenset, symb_cons: Union[str, CharSet]) -> frozenset:
+        """Devuelve los estados alcanzables desde estados_desde consumiendo symb_cons."""
+        estados_alcanzables = set()
+        for estado in estados_desde:
+            estados_alcanzables.update(self.transitions[estado].get(symb_cons, ()))
+        return frozenset(estados_alcanzables)
+
+    def lambda_closure(self, states: set) -> frozenset:
+        """Devuelve la clausura λ de un conjunto de estados."""
+        closure = set(states)
+        states_to_visit = list(states)
+        while len(states_to_visit) > 0:
+            state = states_to_visit.pop()
+            for next_state in self.transitions[state].get(SpecialSymbol.Lambda, ()):
+                if next_state not in closure:
+                    closure.add(next_state)
+                    states_to_visit.append(next_state)
+        return frozenset(closure)
     
     def _rename_state_in_transitions(self, old_name: Hashable, new_name: Hashable):
         """Renombra un estado dentro de las transiciones del autómata."""
@@ -80,7 +131,7 @@ class AFND(AF):
         transitions = {}
         for char in self._get_extended_alphabet():
             if char in self.transitions[state]:
-                transitions[char] = ",".join(self.transitions[state][char])
+                transitions[char] = ",".join(map(str, self.transitions[state][char]))
             else:
                 transitions[char] = "-"
         return transitions
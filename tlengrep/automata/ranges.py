@@ -0,0 +1,216 @@
+from bisect import bisect_right
+from typing import Iterable, Union
+
+__all__ = ["CharSet", "MAX_CODE_POINT", "SURROGATES", "label_key", "minterms", "SymbolMap"]
+
+
+# Mayor código de carácter Unicode
+MAX_CODE_POINT = 0x10FFFF
+# Códigos reservados para los surrogates, que no son caracteres de un texto
+# válido (Python los usa para representar bytes inválidos con surrogateescape)
+SURROGATES = (0xD800, 0xDFFF)
+
+
+class CharSet:
+    """
+    Conjunto de caracteres representado como intervalos de códigos [lo, hi]
+    disjuntos, no adyacentes y ordenados, sin importar cuántos caracteres
+    contenga. Es inmutable y hashable, así que sirve como etiqueta de una
+    transición (junto con los caracteres sueltos) para que una clase como
+    [a-z] o una clase de letras Unicode sea una única transición.
+
+    La pertenencia se resuelve con una búsqueda binaria sobre los inicios de
+    los intervalos.
+    """
+
+    __slots__ = ("ranges", "_starts", "_hash")
+
+    def __init__(self, ranges: Iterable[tuple[Union[str, int], Union[str, int]]]):
+        """
+        Construye el conjunto a partir de pares (desde, hasta), inclusivos,
+        de caracteres o códigos de carácter, en cualquier orden y posiblemente
+        solapados.
+        """
+        intervals = sorted((lo if isinstance(lo, int) else ord(lo), hi if isinstance(hi, int) else ord(hi))
+                           for lo, hi in ranges)
+        merged = []
+        for lo, hi in intervals:
+            if not 0 <= lo <= hi <= MAX_CODE_POINT:
+                raise ValueError(f"El intervalo [{lo}, {hi}] no es un intervalo de caracteres válido.")
+            if merged and lo <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+            else:
+                merged.append((lo, hi))
+        self.ranges = tuple(merged)
+        self._starts = [lo for lo, _ in self.ranges]
+        self._hash = hash(self.ranges)
+
+    @staticmethod
+    def of(chars: Iterable[str]) -> "CharSet":
+        """Construye el conjunto de los caracteres dados."""
+        return CharSet((char, char) for char in chars)
+
+    def complement(self) -> "CharSet":
+        """
+        Devuelve el conjunto de los caracteres que no están en este. Los
+        surrogates nunca están en el complemento, para que [^a] no matchee los
+        bytes inválidos que surrogateescape convierte en surrogates.
+        """
+        gaps = []
+        next = 0
+        for lo, hi in (self | CharSet([SURROGATES])).ranges:
+            if lo > next:
+                gaps.append((next, lo - 1))
+            next = hi + 1
+        if next <= MAX_CODE_POINT:
+            gaps.append((next, MAX_CODE_POINT))
+        return CharSet(gaps)
+
+    def chars(self) -> Iterable[str]:
+        """Recorre los caracteres del conjunto, en orden."""
+        for lo, hi in self.ranges:
+            yield from map(chr, range(lo, hi + 1))
+
+    def __contains__(self, item) -> bool:
+        """
+        Indica si un carácter pertenece al conjunto, o si otro CharSet está
+        incluido en él.
+        """
+        if isinstance(item, CharSet):
+            return all(self._covers(lo, hi) for lo, hi in item.ranges)
+        code = ord(item)
+        return self._covers(code, code)
+
+    def __len__(self) -> int:
+        """Devuelve la cantidad de caracteres del conjunto."""
+        return sum(hi - lo + 1 for lo, hi in self.ranges)
+
+    def __or__(self, other) -> "CharSet":
+        """Unión con otro CharSet o con un conjunto de caracteres."""
+        if isinstance(other, CharSet):
+            return CharSet(self.ranges + other.ranges)
+        if isinstance(other, (set, frozenset)):
+            return CharSet(self.ranges + tuple((ord(char), ord(char)) for char in other))
+        return NotImplemented
+
+    __ror__ = __or__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CharSet) and self.ranges == other.ranges
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        parts = []
+        for lo, hi in self.ranges:
+            parts.append(_escape(lo) if lo == hi else f"{_escape(lo)}-{_escape(hi)}")
+        return f"[{''.join(parts)}]"
+
+    def __repr__(self) -> str:
+        return f"CharSet({list(self.ranges)})"
+
+    def _covers(self, lo: int, hi: int) -> bool:
+        """(Interno) Indica si el intervalo [lo, hi] está incluido en uno de los intervalos."""
+        i = bisect_right(self._starts, lo) - 1
+        return i >= 0 and hi <= self.ranges[i][1]
+
+
+def _escape(code: int) -> str:
+    """(Interno) Representación de un código de carácter dentro de una clase."""
+    char = chr(code)
+    if char in "\\]-^":
+        return "\\" + char
+    if char.isprintable():
+        return char
+    return f"\\u{code:04x}" if code <= 0xFFFF else f"\\U{code:08x}"
+
+
+def _intervals(label) -> tuple[tuple[int, int], ...]:
+    """(Interno) Intervalos de códigos de una etiqueta (un carácter o un CharSet)."""
+    if isinstance(label, CharSet):
+        return label.ranges
+    return ((ord(label), ord(label)),)
+
+
+def label_key(label) -> tuple[int, int]:
+    """
+    Clave para ordenar etiquetas de transición (caracteres y CharSet) por su
+    primer código de carácter.
+    """
+    intervals = _intervals(label)
+    return intervals[0][0], intervals[-1][1]
+
+
+def minterms(labels: Iterable) -> list[tuple[object, tuple]]:
+    """
+    Parte un conjunto de etiquetas de transición (caracteres y CharSet,
+    posiblemente solapados) en sus mintérminos: los conjuntos de caracteres
+    maximales que pertenecen exactamente a las mismas etiquetas. Devuelve,
+    ordenados por su primer carácter, pares (mintérmino, etiquetas que lo
+    contienen); un mintérmino de un único carácter es ese carácter, y si no,
+    un CharSet. Los caracteres que no están en ninguna etiqueta se omiten.
+
+    Si todas las etiquetas son caracteres, cada uno es su propio mintérmino.
+    """
+    labels = list(dict.fromkeys(labels))
+    if not any(isinstance(label, CharSet) for label in labels):
+        return [(label, (label,)) for label in sorted(labels, key=label_key)]
+
+    # Barrido sobre los bordes de los intervalos: entre dos bordes
+    # consecutivos, las etiquetas activas no cambian
+    events = {}
+    for index, label in enumerate(labels):
+        for lo, hi in _intervals(label):
+            events.setdefault(lo, []).append((True, index))
+            events.setdefault(hi + 1, []).append((False, index))
+    points = sorted(events)
+    active = set()
+    groups = {}
+    for point, next_point in zip(points, points[1:]):
+        for starts, index in events[point]:
+            if starts:
+                active.add(index)
+            else:
+                active.discard(index)
+        if active:
+            groups.setdefault(frozenset(active), []).append((point, next_point - 1))
+
+    result = []
+    for covering, intervals in groups.items():
+        if len(intervals) == 1 and intervals[0][0] == intervals[0][1]:
+            symbol = chr(intervals[0][0])
+        else:
+            symbol = CharSet(intervals)
+        result.append((symbol, tuple(labels[index] for index in sorted(covering))))
+    result.sort(key=lambda item: label_key(item[0]))
+    return result
+
+
+class SymbolMap(dict):
+    """
+    Traducción de caracteres a etiquetas, para un conjunto de etiquetas
+    disjuntas (por ejemplo, los mintérminos de un autómata): carácter ->
+    etiqueta que lo contiene, o None. Los caracteres sueltos se buscan
+    directamente; el resto se busca la primera vez con bisect sobre los
+    intervalos de los CharSet, y el resultado queda guardado.
+    """
+
+    def __init__(self, labels: Iterable):
+        super().__init__()
+        intervals = []
+        for label in labels:
+            if isinstance(label, CharSet):
+                intervals.extend((lo, hi, label) for lo, hi in label.ranges)
+            else:
+                self[label] = label
+        intervals.sort(key=lambda interval: interval[0])
+        self._starts = [lo for lo, _, _ in intervals]
+        self._intervals = intervals
+
+    def __missing__(self, char: str):
+        code = ord(char)
+        i = bisect_right(self._starts, code) - 1
+        label = self._intervals[i][2] if i >= 0 and code <= self._intervals[i][1] else None
+        self[char] = label
+        return label
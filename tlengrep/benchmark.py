@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import glob
+import importlib
+import optparse
+import time
+from os.path import basename, dirname, join
+
+from tabulate import tabulate
+
+from engines import CONSTRUCTIONS, ENGINES
+
+usage = "%prog [options]"
+
+opt_parser = optparse.OptionParser(usage=usage)
+opt_parser.add_option("-e", "--engine", dest="engines", action="append", choices=list(ENGINES),
+                      help="engine to benchmark (can be repeated) [default: all but memo]")
+opt_parser.add_option("-c", "--construction", dest="construction", choices=list(CONSTRUCTIONS),
+                      default="thompson", help="AFND construction for the automata engines [default: %default]")
+opt_parser.add_option("-a", "--afnd", dest="afnd", action="store_true",
+                      help="compare the AFND constructions (states and build time) instead of the engines")
+opt_parser.add_option("-b", "--batch", dest="batch", action="store_true",
+                      help="match all the input strings in a single match_many call")
+opt_parser.add_option("-r", "--repeat", dest="repeat", type="int", default=20,
+                      help="times to match every input string [default: %default]")
+opts, args = opt_parser.parse_args()
+
+engines = opts.engines or [engine for engine in ENGINES if engine != "memo"]
+
+# Casos: las expresiones regulares de los tests y las cadenas de entrada
+tests_dir = join(dirname(__file__), "tests")
+cases = []
+for filename in sorted(glob.glob(join(tests_dir, "regexes/*.py"))):
+    regex_module = importlib.import_module(f"tests.regexes.{basename(filename)[:-3]}")
+    cases.append((basename(filename)[:-3], regex_module.__regex__))
+
+strings = []
+for filename in glob.glob(join(tests_dir, "strings/*.txt")):
+    with open(filename) as f:
+        strings.extend(f.read().splitlines())
+
+
+def benchmark_engines():
+    """
+    Compara el tiempo de compilar y matchear de cada motor. Cada matcher se
+    construye directamente con el motor de la columna, sin el prefiltro ni
+    los reemplazos que hace compile_regex (literales, repeticiones grandes).
+    """
+    table = []
+    totals = dict.fromkeys(engines, 0.0)
+    for name, regex in cases:
+        row = [name]
+        for engine in engines:
+            start = time.perf_counter()
+            matcher = ENGINES[engine](regex, CONSTRUCTIONS[opts.construction], False)
+            for _ in range(opts.repeat):
+                if opts.batch:
+                    matcher.match_many(strings)
+                    continue
+                for string in strings:
+                    matcher.match(string)
+            elapsed = time.perf_counter() - start
+            totals[engine] += elapsed
+            row.append(f"{elapsed * 1000:.1f}")
+        table.append(row)
+    table.append(["total"] + [f"{totals[engine] * 1000:.1f}" for engine in engines])
+
+    print(f"Tiempo (ms) en compilar y matchear {len(strings)} cadenas x {opts.repeat}")
+    print(tabulate(table, ["Regex"] + engines, tablefmt="fancy_grid"))
+
+
+def benchmark_constructions():
+    """Compara la cantidad de estados y el tiempo de construcción de cada AFND."""
+    table = []
+    for name, regex in cases:
+        row = [name]
+        for construction in CONSTRUCTIONS.values():
+            start = time.perf_counter()
+            for _ in range(opts.repeat):
+                afnd = construction(regex)
+            elapsed = time.perf_counter() - start
+            row.extend([afnd.size(), f"{elapsed * 1000 / opts.repeat:.2f}"])
+        table.append(row)
+
+    header = ["Regex"]
+    for construction in CONSTRUCTIONS:
+        header.extend([f"{construction} (estados)", f"{construction} (ms)"])
+    print(f"Estados y tiempo de construcción (ms, promedio de {opts.repeat}) de cada AFND")
+    print(tabulate(table, header, tablefmt="fancy_grid"))
+
+
+if opts.afnd:
+    benchmark_constructions()
+else:
+    benchmark_engines()
@@ -0,0 +1,131 @@
+from engines.ahocorasick import AhoCorasick
+from engines.bitparallel import BitParallelMatcher
+from engines.codegen import CodegenDFA, generate_source, write_module
+from engines.derivatives import DerivativeBuilder, DerivativeMatcher
+from engines.lazydfa import LazyDFA
+from engines.literal import LiteralMatcher
+from engines.memo import MemoMatcher
+from engines.multi import MultiMatcher, union_afnd
+from engines.pikevm import PikeVM, SparseSet
+from engines.prefilter import Prefilter
+from engines.span import SpanMatcher
+from engines.table import TableDFA
+from engines.utf8 import ByteDFA, utf8_afnd, utf8_sequences
+from engines.vectorized import VectorizedDFA, np
+
+# Construcciones de AFND disponibles: nombre -> función que convierte una RegEx
+CONSTRUCTIONS = {
+    "thompson": lambda regex: regex.to_afnd(),
+    "glushkov": lambda regex: regex.to_afnd_glushkov(),
+    "antimirov": lambda regex: regex.to_afnd_antimirov(),
+}
+
+# Motores disponibles: nombre -> función que compila una RegEx, usando la
+# construcción de AFND indicada (los motores que no simulan un AFND la ignoran),
+# en modo match (toda la cadena) o búsqueda (alguna subcadena). El motor
+# vectorized solo está disponible si NumPy está instalado
+ENGINES = {
+    "memo": lambda regex, afnd, search: MemoMatcher(regex, search),
+    "pikevm": lambda regex, afnd, search: PikeVM(afnd(regex), search),
+    "lazydfa": lambda regex, afnd, search: LazyDFA(afnd(regex), search=search),
+    "table": lambda regex, afnd, search: TableDFA(afnd(regex).determinize(search), search),
+    "codegen": lambda regex, afnd, search: CodegenDFA(afnd(regex).determinize(search).minimize(), search),
+    "derivatives": lambda regex, afnd, search: DerivativeMatcher(regex, search),
+    "bitparallel": lambda regex, afnd, search: BitParallelMatcher(regex, search=search),
+}
+if np is not None:
+    ENGINES["vectorized"] = lambda regex, afnd, search: VectorizedDFA(
+        afnd(regex).determinize(search).minimize(), search)
+
+# Tamaño desenrollado (ver RegEx.unrolled_size) a partir del cual compile_regex
+# usa el motor de derivadas en lugar de construir un autómata
+MAX_UNROLLED_SIZE = 2000
+
+
+def compile_regex(regex, engine: str = "pikevm", construction: str = "thompson", search: bool = False):
+    """
+    Compila una expresión regular con el motor y la construcción de AFND
+    indicados. Salvo para el motor de referencia (memo), la expresión se
+    simplifica antes de compilarla y el matcher se envuelve en un Prefilter,
+    que descarta por largo, primer y último carácter y literales obligatorios
+    las cadenas que no pueden matchear.
+
+    Si search es True, el matcher devuelto busca el patrón en cualquier parte
+    de la cadena (como grep) en lugar de exigir que la acepte entera.
+
+    Las expresiones que son una palabra o una unión de palabras (ver
+    RegEx.literal_words) se compilan siempre, sin simplificarlas ni construir
+    ningún AFND, a un LiteralMatcher o a un autómata de Aho-Corasick.
+
+    Las expresiones con repeticiones acotadas cuyo tamaño desenrollado supera
+    MAX_UNROLLED_SIZE se compilan con el motor de derivadas, que guarda las
+    cotas como enteros, en lugar de construir un autómata de ese tamaño.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"El motor {engine} no existe. Opciones: {', '.join(ENGINES)}.")
+    if construction not in CONSTRUCTIONS:
+        raise ValueError(f"La construcción {construction} no existe. Opciones: {', '.join(CONSTRUCTIONS)}.")
+    if engine == "memo":
+        return ENGINES[engine](regex, CONSTRUCTIONS[construction], search)
+
+    words = regex.literal_words()
+    if words and len(words) == 1:
+        return LiteralMatcher(words[0], search)
+    if words:
+        return AhoCorasick(words, search)
+
+    regex = regex.simplify()
+    if regex.unrolled_size() > MAX_UNROLLED_SIZE:
+        engine = "derivatives"
+    matcher = ENGINES[engine](regex, CONSTRUCTIONS[construction], search)
+    return Prefilter(regex, matcher, search)
+
+
+def compile_patterns(regexes: list, construction: str = "thompson", search: bool = False) -> MultiMatcher:
+    """
+    Compila varias expresiones regulares en un único MultiMatcher, que
+    indica cuáles de ellas matchean cada cadena (o aparecen en ella, si
+    search es True).
+    """
+    if construction not in CONSTRUCTIONS:
+        raise ValueError(f"La construcción {construction} no existe. Opciones: {', '.join(CONSTRUCTIONS)}.")
+    return MultiMatcher([CONSTRUCTIONS[construction](regex.simplify()) for regex in regexes], search=search)
+
+
+def compile_spans(regex, construction: str = "thompson"):
+    """
+    Compila una expresión regular para buscar sus apariciones leftmost-longest
+    (ver SpanMatcher). Devuelve un objeto con los métodos span(word) y
+    spans(word); si la expresión es una única palabra, un LiteralMatcher, y si
+    es una unión de palabras, un autómata de Aho-Corasick.
+    """
+    if construction not in CONSTRUCTIONS:
+        raise ValueError(f"La construcción {construction} no existe. Opciones: {', '.join(CONSTRUCTIONS)}.")
+    words = regex.literal_words()
+    if words and len(words) == 1:
+        return LiteralMatcher(words[0], search=True)
+    if words:
+        return AhoCorasick(words, search=True)
+    return SpanMatcher(CONSTRUCTIONS[construction](regex.simplify()))
+
+
+def compile_bytes(regex, construction: str = "thompson", search: bool = False):
+    """
+    Compila una expresión regular para matchear cadenas de bytes en UTF-8
+    sin decodificarlas: el AFND se convierte en uno sobre bytes (ver
+    utf8_afnd), que se determiniza, se minimiza y se compila a un ByteDFA
+    envuelto en un Prefilter. Las cadenas que no son UTF-8 válido no
+    producen errores. Si la expresión es una única palabra, se usa un
+    LiteralMatcher sobre su codificación, y si es una unión de palabras, un
+    autómata de Aho-Corasick sobre sus codificaciones.
+    """
+    if construction not in CONSTRUCTIONS:
+        raise ValueError(f"La construcción {construction} no existe. Opciones: {', '.join(CONSTRUCTIONS)}.")
+    words = regex.literal_words()
+    if words and len(words) == 1:
+        return LiteralMatcher(words[0].encode(), search)
+    if words:
+        return AhoCorasick([word.encode() for word in words], search)
+    regex = regex.simplify()
+    afd = utf8_afnd(CONSTRUCTIONS[construction](regex)).determinize(search).minimize()
+    return Prefilter(regex, ByteDFA(afd, search), search, binary=True)
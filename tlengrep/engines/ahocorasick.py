@@ -0,0 +1,131 @@
+from typing import Iterable, Iterator, Optional
+
+__all__ = ["AhoCorasick"]
+
+
+class AhoCorasick:
+    """
+    Matcher para uniones de palabras (ver RegEx.literal_words), con un
+    autómata de Aho-Corasick: un trie de las palabras, numerado en orden BFS
+    (0 es la raíz), con enlaces de falla (el nodo del sufijo propio más largo
+    que también está en el trie) y enlaces de salida (el nodo más cercano,
+    siguiendo las fallas, en el que termina una palabra), que representan el
+    conjunto de palabras que terminan en cada posición.
+
+    Si search es False, match recorre solo el trie y acepta la cadena si es
+    exactamente una de las palabras. Si search es True, match sigue las
+    fallas y termina en la primera posición en la que termina alguna
+    palabra. Todo el autómata se construye y recorre de forma iterativa,
+    sin importar la cantidad de palabras.
+
+    Las palabras también pueden ser cadenas de bytes (ver
+    engines.compile_bytes): el trie queda indexado por los bytes.
+    """
+
+    def __init__(self, words: list[str], search: bool = False):
+        self.words = words
+        self.search = search
+        self.goto = [{}]
+        # Índice de la palabra que termina en cada nodo (-1 si ninguna)
+        self.ends = [-1]
+        for i, word in enumerate(words):
+            node = 0
+            for char in word:
+                next = self.goto[node].get(char)
+                if next is None:
+                    next = self.goto[node][char] = len(self.goto)
+                    self.goto.append({})
+                    self.ends.append(-1)
+                node = next
+            if self.ends[node] < 0:
+                self.ends[node] = i
+
+        self.fail = [0] * len(self.goto)
+        self.output = [-1] * len(self.goto)
+        nodes_to_visit = list(self.goto[0].values())
+        for node in nodes_to_visit:
+            fail = self.fail[node]
+            self.output[node] = fail if self.ends[fail] >= 0 else self.output[fail]
+            for char, next in self.goto[node].items():
+                fail = self.fail[node]
+                while fail != 0 and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next] = self.goto[fail].get(char, 0)
+                nodes_to_visit.append(next)
+        # En modo búsqueda, un nodo es final si su conjunto de salida no es vacío
+        self.accepting = bytearray(ends >= 0 or output >= 0 for ends, output in zip(self.ends, self.output))
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la cadena es una de las palabras (o, en modo búsqueda, si
+        contiene alguna).
+        """
+        goto = self.goto
+        node = 0
+        if not self.search:
+            for char in word:
+                node = goto[node].get(char)
+                if node is None:
+                    return False
+            return self.ends[node] >= 0
+
+        fail, accepting = self.fail, self.accepting
+        if accepting[0]:
+            return True
+        for char in word:
+            while node != 0 and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if accepting[node]:
+                return True
+        return False
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si es una de las palabras (o si contiene alguna) (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def occurrences(self, word: str) -> list[tuple[int, int, int]]:
+        """
+        Devuelve todas las apariciones de las palabras en la cadena, como
+        ternas (inicio, fin, índice de la palabra), ordenadas por fin.
+        """
+        goto, fail, ends, output = self.goto, self.fail, self.ends, self.output
+        occurrences = []
+        node = 0
+        for end in range(len(word) + 1):
+            if end > 0:
+                char = word[end - 1]
+                while node != 0 and char not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(char, 0)
+            match = node if ends[node] >= 0 else output[node]
+            while match >= 0:
+                index = ends[match]
+                occurrences.append((end - len(self.words[index]), end, index))
+                match = output[match]
+        return occurrences
+
+    def spans(self, word: str) -> Iterator[tuple[int, int]]:
+        """
+        Devuelve, de izquierda a derecha, las apariciones leftmost-longest de
+        las palabras que no se solapan, como pares (inicio, fin) (ver
+        SpanMatcher.spans), a partir de todas las apariciones en la cadena.
+        """
+        longest = {}
+        for start, end, _ in self.occurrences(word):
+            if end > longest.get(start, -1):
+                longest[start] = end
+        position = 0
+        for start in sorted(longest):
+            if start >= position:
+                end = longest[start]
+                yield start, end
+                position = end if end > start else end + 1
+
+    def span(self, word: str) -> Optional[tuple[int, int]]:
+        """Devuelve (inicio, fin) de la aparición leftmost-longest de las palabras, o None."""
+        return next(self.spans(word), None)
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del autómata."""
+        return {"words": len(self.words), "nodes": len(self.goto)}
@@ -0,0 +1,100 @@
+from typing import Iterable
+
+from automata import CharSet
+from automata.ranges import SymbolMap, minterms
+from regex import RegEx
+
+__all__ = ["BitParallelMatcher"]
+
+
+class BitParallelMatcher:
+    """
+    Simulación bit-paralela del autómata de posiciones (Glushkov).
+
+    Cada estado del autómata es un bit de un entero de Python, así que no hay
+    límite en el tamaño del patrón. Como en el autómata de Glushkov todas las
+    transiciones que entran a una posición tienen el mismo carácter, un paso
+    es follow(D) & B[c], donde B[c] son las posiciones del carácter c
+    (precalculadas). follow(D) se memoiza por conjunto D, con un caché acotado
+    a max_cache entradas que se vacía al llenarse.
+
+    Si search es True, match busca el patrón en cualquier parte de la cadena:
+    la posición inicial se vuelve a activar en cada paso (como si el patrón
+    empezara con Σ*) y la simulación termina apenas se activa una final.
+
+    Si la expresión tiene clases de caracteres, las máscaras se calculan por
+    mintérmino de las etiquetas de las posiciones (ver
+    automata.ranges.minterms) y cada carácter se traduce a su mintérmino con
+    un SymbolMap.
+    """
+
+    def __init__(self, regex: RegEx, max_cache: int = 4096, search: bool = False):
+        automaton = regex.position_automaton()
+        self.search = search
+        self.size = automaton.size()
+        self.max_cache = max_cache
+        self.final = automaton.final
+        masks = {}
+        for position, char in enumerate(automaton.chars):
+            if char is not None:
+                masks[char] = masks.get(char, 0) | (1 << position)
+        symbols = minterms(masks)
+        self.masks = {}
+        for symbol, labels in symbols:
+            for label in labels:
+                self.masks[symbol] = self.masks.get(symbol, 0) | masks[label]
+        # Traducción carácter -> mintérmino (None si no hay clases de caracteres)
+        self.symbols = SymbolMap(symbol for symbol, _ in symbols) \
+            if any(isinstance(char, CharSet) for char in masks) else None
+        self._follow = automaton.follow
+        self._follow_cache = {}
+        self.cache_hits = 0
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta la cadena dada (o, en modo
+        búsqueda, si acepta alguna subcadena).
+        """
+        masks = self.masks
+        symbols = self.symbols
+        follow_cache = self._follow_cache
+        final = self.final
+        # En modo búsqueda la posición inicial (el bit 0) queda siempre activa
+        restart = 1 if self.search else 0
+        states = 1
+        for char in word:
+            if restart and states & final:
+                return True
+            reachable = follow_cache.get(states)
+            if reachable is None:
+                reachable = self._follow_of(states)
+            else:
+                self.cache_hits += 1
+            if symbols is not None:
+                char = symbols[char]
+            states = reachable & masks.get(char, 0) | restart
+            if not states:
+                return False
+        return states & final != 0
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si la expresión regular la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del autómata y del caché de follow."""
+        return {"positions": self.size, "follow_cache": len(self._follow_cache),
+                "cache_hits": self.cache_hits}
+
+    def _follow_of(self, states: int) -> int:
+        """Calcula (y guarda en el caché) la unión de follow(p) para p en states."""
+        reachable = 0
+        remaining = states
+        while remaining:
+            bit = remaining & -remaining
+            reachable |= self._follow[bit.bit_length() - 1]
+            remaining ^= bit
+        if len(self._follow_cache) >= self.max_cache:
+            self._follow_cache.clear()
+        self._follow_cache[states] = reachable
+        return reachable
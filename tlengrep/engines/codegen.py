@@ -0,0 +1,107 @@
+from typing import Iterable
+
+from automata import AFD, CharSet
+from automata.ranges import label_key
+
+__all__ = ["generate_source", "write_module", "CodegenDFA"]
+
+
+def generate_source(afd: AFD, name: str = "match", search: bool = False) -> str:
+    """
+    Genera el código fuente de una función de Python name(word) -> bool
+    especializada para el AFD: cada estado es una rama de un if/elif y cada
+    transición una comparación literal (o un test de pertenencia a un string
+    si varios caracteres llevan al mismo estado, y comparaciones de rango
+    para los intervalos de un CharSet). Las transiciones a estados muertos
+    (ver AFD.dead_states) terminan con return False.
+
+    Si search es True, el AFD debe ser el de Σ*L (ver AFND.determinize): los
+    caracteres fuera del alfabeto vuelven al estado inicial y las
+    transiciones a estados finales terminan con return True.
+    """
+    states = [afd.initial_state] + sorted(afd.states - {afd.initial_state}, key=str)
+    numbers = {state: i for i, state in enumerate(states)}
+    dead_states = afd.dead_states()
+    # En modo búsqueda, alcanzar un estado final ya decide la cadena
+    stop_states = afd.final_states if search else set()
+
+    lines = [f"def {name}(word):", "    state = 0"]
+    if afd.initial_state in dead_states or afd.initial_state in stop_states:
+        lines.append(f"    return {afd.initial_state in stop_states}")
+        return "\n".join(lines) + "\n"
+
+    lines.append("    for char in word:")
+    keyword = "if"
+    for state in states:
+        if state in dead_states or state in stop_states:
+            continue
+        lines.append(f"        {keyword} state == {numbers[state]}:")
+        keyword = "elif"
+
+        # Agrupamos los caracteres por estado destino
+        targets = {}
+        for char, next_state in sorted(afd.transitions[state].items(), key=lambda item: label_key(item[0])):
+            targets.setdefault(next_state, []).append(char)
+
+        branch = "if"
+        for next_state, chars in targets.items():
+            if next_state in dead_states:
+                continue
+            condition = _condition(chars)
+            lines.append(f"            {branch} {condition}:")
+            if next_state in stop_states:
+                lines.append("                return True")
+            else:
+                lines.append(f"                state = {numbers[next_state]}")
+            branch = "elif"
+        otherwise = "state = 0" if search else "return False"
+        if branch == "if":
+            lines.append(f"            {otherwise}")
+        else:
+            lines.append("            else:")
+            lines.append(f"                {otherwise}")
+
+    final_states = sorted(numbers[state] for state in afd.final_states)
+    lines.append(f"    return state in {set(final_states) if final_states else 'set()'}")
+    return "\n".join(lines) + "\n"
+
+
+def _condition(chars: list) -> str:
+    """(Interno) Condición de Python que indica si char es uno de los caracteres o está en uno de los CharSet."""
+    singles = [char for char in chars if isinstance(char, str)]
+    ranges = [interval for charset in chars if isinstance(charset, CharSet) for interval in charset.ranges]
+    conditions = []
+    if singles:
+        conditions.append(f"char == {singles[0]!r}" if len(singles) == 1 else f"char in {''.join(singles)!r}")
+    conditions.extend(f"{chr(lo)!r} <= char <= {chr(hi)!r}" for lo, hi in sorted(ranges))
+    return " or ".join(conditions)
+
+
+def write_module(afd: AFD, path: str, name: str = "match", search: bool = False):
+    """Escribe en path un módulo de Python importable con el matcher generado."""
+    with open(path, "w") as f:
+        f.write("# Generado por engines.codegen: no editar a mano.\n\n\n")
+        f.write(generate_source(afd, name, search))
+
+
+class CodegenDFA:
+    """
+    Matcher que ejecuta el código generado por generate_source para el AFD
+    (compilado con compile() y exec). Conviene usarlo con un AFD minimizado,
+    ya que el código tiene una rama por estado.
+    """
+
+    def __init__(self, afd: AFD, search: bool = False):
+        self.size = afd.size()
+        self.source = generate_source(afd, search=search)
+        namespace = {}
+        exec(compile(self.source, "<tlengrep codegen>", "exec"), namespace)
+        self.match = namespace["match"]
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si el autómata la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del código generado."""
+        return {"states": self.size, "source_lines": self.source.count("\n")}
@@ -0,0 +1,207 @@
+from typing import Iterable, Optional
+
+from automata import CharSet
+from regex import RegEx, Empty, Lambda, Char, CharClass, Concat, Union, Star, Plus, Repeat
+
+__all__ = ["DerivativeBuilder", "DerivativeMatcher"]
+
+
+class DerivativeMatcher:
+    """
+    Matcher basado en derivadas de Brzozowski: la cadena se consume de a un
+    carácter, reemplazando la expresión actual por su derivada. Al final, la
+    cadena es aceptada si la expresión resultante acepta λ.
+
+    Las derivadas se construyen con un DerivativeBuilder, por lo que son
+    finitas. Cada par (expresión, carácter) se calcula una sola vez: el caché
+    es un AFD implícito que se reutiliza entre todas las cadenas. No se
+    construye ningún AFND.
+
+    Si search es True, match busca el patrón en cualquier parte de la cadena:
+    a cada derivada se le suma (con una unión) la expresión original, como si
+    empezara con Σ*, y la búsqueda termina en la primera derivada que acepta λ.
+    """
+
+    def __init__(self, regex: RegEx, search: bool = False):
+        self.search = search
+        self.cache_hits = 0
+        # Modo búsqueda: derivada -> unión de la derivada con la expresión original
+        self._restarts = {}
+        self.builder = DerivativeBuilder()
+        self.start = self.builder.build(regex)
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta la cadena dada (o, en modo
+        búsqueda, si acepta alguna subcadena).
+        """
+        builder = self.builder
+        derivatives = builder.derivatives
+        empty = builder.empty
+        search = self.search
+        exp = self.start
+        for char in word:
+            if search and builder.nullable(exp):
+                return True
+            next = derivatives.get((exp, char))
+            if next is None:
+                next = builder.derive(exp, char)
+            else:
+                self.cache_hits += 1
+            if search:
+                restarted = self._restarts.get(next)
+                if restarted is None:
+                    restarted = self._restarts[next] = builder.union(next, self.start)
+                next = restarted
+            elif next is empty:
+                return False
+            exp = next
+        return builder.nullable(exp)
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si la expresión regular la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño de los cachés de expresiones y derivadas."""
+        return {"expressions": len(self.builder.interned), "derivatives": len(self.builder.derivatives),
+                "cache_hits": self.cache_hits}
+
+
+class DerivativeBuilder:
+    """
+    Constructor de expresiones regulares con hash-consing (cada subexpresión
+    distinta existe una única vez) y reglas de similitud (∅r = ∅, λr = r,
+    r|r = r, r|∅ = r, (r*)* = r*, asociatividad y conmutatividad de la unión).
+    Memoiza las derivadas y derivadas parciales de las expresiones que
+    construye.
+    """
+
+    def __init__(self):
+        self.interned = {}
+        self.derivatives = {}
+        self.partial_derivatives = {}
+        self._order = {}
+        self._nullable = {}
+        self.empty = self._intern(Empty())
+        self.lambda_ = self._intern(Lambda())
+
+    def derive(self, exp: RegEx, char: str) -> RegEx:
+        """Devuelve la derivada (memoizada) de una expresión ya construida."""
+        key = (exp, char)
+        if key not in self.derivatives:
+            self.derivatives[key] = exp._derivative(char, self)
+        return self.derivatives[key]
+
+    def partial_derive(self, exp: RegEx, char: str) -> frozenset[RegEx]:
+        """Devuelve las derivadas parciales (memoizadas) de una expresión ya construida."""
+        key = (exp, char)
+        if key not in self.partial_derivatives:
+            self.partial_derivatives[key] = exp._partial_derivatives(char, self)
+        return self.partial_derivatives[key]
+
+    def nullable(self, exp: RegEx) -> bool:
+        """Indica (memoizado) si una expresión ya construida acepta λ."""
+        if exp not in self._nullable:
+            self._nullable[exp] = exp.nullable()
+        return self._nullable[exp]
+
+    def build(self, regex: RegEx) -> RegEx:
+        """Reconstruye una expresión regular con los constructores simplificadores."""
+        if isinstance(regex, Empty):
+            return self.empty
+        if isinstance(regex, Lambda):
+            return self.lambda_
+        if isinstance(regex, Char):
+            return self.char(regex.char)
+        if isinstance(regex, CharClass):
+            return self.char_class(regex.chars)
+        if isinstance(regex, Concat):
+            return self.concat(self.build(regex.exp1), self.build(regex.exp2))
+        if isinstance(regex, Union):
+            return self.union(self.build(regex.exp1), self.build(regex.exp2))
+        if isinstance(regex, Star):
+            return self.star(self.build(regex.exp))
+        if isinstance(regex, Plus):
+            exp = self.build(regex.exp)
+            return self.concat(exp, self.star(exp))
+        if isinstance(regex, Repeat):
+            return self.repeat(self.build(regex.exp), regex.min, regex.max)
+        raise ValueError(f"La expresión {regex} no es soportada por el motor de derivadas.")
+
+    def char(self, char: str) -> RegEx:
+        """Construye la expresión de un carácter."""
+        return self._intern(Char(char))
+
+    def char_class(self, chars: CharSet) -> RegEx:
+        """Construye la expresión de una clase de caracteres, simplificando las de 0 y 1 caracteres."""
+        if len(chars) == 0:
+            return self.empty
+        if len(chars) == 1:
+            return self.char(next(chars.chars()))
+        return self._intern(CharClass(chars))
+
+    def concat(self, exp1: RegEx, exp2: RegEx) -> RegEx:
+        """Construye la concatenación, simplificando ∅ y λ."""
+        if exp1 is self.empty or exp2 is self.empty:
+            return self.empty
+        if exp1 is self.lambda_:
+            return exp2
+        if exp2 is self.lambda_:
+            return exp1
+        if isinstance(exp1, Concat):
+            # Asociamos a derecha: (rs)t = r(st)
+            return self.concat(exp1.exp1, self.concat(exp1.exp2, exp2))
+        return self._intern(Concat(exp1, exp2))
+
+    def union(self, exp1: RegEx, exp2: RegEx) -> RegEx:
+        """Construye la unión, sin repetidos, sin ∅ y con las alternativas ordenadas."""
+        alternatives = set()
+        for exp in (exp1, exp2):
+            while isinstance(exp, Union):
+                alternatives.add(exp.exp1)
+                exp = exp.exp2
+            alternatives.add(exp)
+        alternatives.discard(self.empty)
+        if len(alternatives) == 0:
+            return self.empty
+
+        # Ordenamos las alternativas para que r|s y s|r sean la misma expresión
+        ordered = sorted(alternatives, key=self._order.__getitem__)
+        union = ordered.pop()
+        while ordered:
+            exp = ordered.pop()
+            union = self._intern(Union(exp, union))
+        return union
+
+    def star(self, exp: RegEx) -> RegEx:
+        """Construye la clausura de Kleene, simplificando ∅*, λ* y (r*)*."""
+        if exp is self.empty or exp is self.lambda_:
+            return self.lambda_
+        if isinstance(exp, Star):
+            return exp
+        return self._intern(Star(exp))
+
+    def repeat(self, exp: RegEx, min: int, max: Optional[int]) -> RegEx:
+        """
+        Construye la repetición acotada, simplificando r{0,0}, ∅{m,n} y
+        λ{m,n}, y llevando r{0,} y r{1,} a clausuras. Las cotas quedan como
+        enteros en el nodo: las derivadas de r{m,n} son de la forma
+        d·r{m-1,n-1}, de tamaño proporcional al patrón y no a las cotas.
+        """
+        if max == 0 or exp is self.lambda_:
+            return self.lambda_
+        if exp is self.empty:
+            return self.lambda_ if min == 0 else self.empty
+        if max is None and min <= 1:
+            return self.star(exp) if min == 0 else self.concat(exp, self.star(exp))
+        if min == max == 1:
+            return exp
+        return self._intern(Repeat(exp, min, max))
+
+    def _intern(self, exp: RegEx) -> RegEx:
+        """Devuelve la única instancia de una expresión estructuralmente igual a exp."""
+        exp = self.interned.setdefault(exp, exp)
+        if exp not in self._order:
+            self._order[exp] = len(self._order)
+        return exp
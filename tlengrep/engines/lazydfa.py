@@ -0,0 +1,117 @@
+from typing import Iterable
+
+from automata import AFND
+from engines.pikevm import PikeVM, SparseSet
+
+__all__ = ["LazyDFA"]
+
+
+class _DFAState:
+    """(Interno) Estado del AFD construido sobre la marcha."""
+
+    __slots__ = ("nfa_states", "accepting", "transitions")
+
+    def __init__(self, nfa_states: frozenset, accepting: bool):
+        self.nfa_states = nfa_states
+        self.accepting = accepting
+        self.transitions = {}
+
+
+class LazyDFA:
+    """
+    AFD perezoso: en lugar de determinizar todo el AFND antes de empezar,
+    construye cada estado del AFD (un conjunto de estados del AFND) recién
+    cuando la cadena de entrada lo alcanza, y guarda las transiciones ya
+    calculadas en un caché.
+
+    El caché tiene a lo sumo max_states estados. Cuando se llena, se vacía
+    por completo y se sigue construyendo desde el estado actual, de modo que
+    la memoria queda acotada aunque el AFD completo sea exponencial.
+
+    Si search es True, se construye perezosamente el AFD de Σ*L (ver
+    PikeVM) y match termina en el primer estado final que alcanza.
+
+    Las transiciones del caché se guardan por carácter; si el AFND tiene
+    clases de caracteres, al calcular una transición nueva el carácter se
+    traduce a su mintérmino (ver PikeVM).
+    """
+
+    def __init__(self, afnd: AFND, max_states: int = 1024, search: bool = False):
+        if max_states < 3:
+            raise ValueError("El caché debe admitir al menos 3 estados.")
+        self.nfa = PikeVM(afnd)
+        self.search = search
+        self.max_states = max_states
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.flushes = 0
+        self._cache = {}
+        self._destinations = SparseSet(self.nfa.size)
+        self._start = self._intern(frozenset(self.nfa.start))
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si el autómata acepta la cadena dada (o, en modo búsqueda, si
+        acepta alguna subcadena).
+        """
+        state = self._start
+        search = self.search
+        for char in word:
+            if search and state.accepting:
+                return True
+            next = state.transitions.get(char)
+            if next is None:
+                next = self._step(state, char)
+            else:
+                self.cache_hits += 1
+            if not next.nfa_states:
+                return False
+            state = next
+        return state.accepting
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si el autómata la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve las estadísticas del caché de estados."""
+        return {"states": len(self._cache), "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses, "flushes": self.flushes}
+
+    def _step(self, state: _DFAState, char: str) -> _DFAState:
+        """Calcula (y guarda en el caché) la transición de state por char."""
+        self.cache_misses += 1
+        program = self.nfa.program
+        symbol = char if self.nfa.symbols is None else self.nfa.symbols[char]
+        destinations = self._destinations
+        destinations.clear()
+        for nfa_state in state.nfa_states:
+            targets = program[nfa_state].get(symbol)
+            if targets:
+                self.nfa.add_closure(destinations, targets)
+        if self.search:
+            self.nfa.add_closure(destinations, self.nfa.start)
+        nfa_states = frozenset(destinations)
+
+        next = self._cache.get(nfa_states)
+        if next is None:
+            if len(self._cache) >= self.max_states:
+                self._flush(state)
+            next = self._intern(nfa_states)
+        state.transitions[char] = next
+        return next
+
+    def _intern(self, nfa_states: frozenset) -> _DFAState:
+        """Agrega un estado nuevo al caché."""
+        accepting = any(self.nfa.accepting[nfa_state] for nfa_state in nfa_states)
+        state = _DFAState(nfa_states, accepting)
+        self._cache[nfa_states] = state
+        return state
+
+    def _flush(self, current: _DFAState):
+        """Vacía el caché, conservando el estado inicial y el actual."""
+        self.flushes += 1
+        for state in self._cache.values():
+            state.transitions.clear()
+        self._cache = {self._start.nfa_states: self._start}
+        self._cache[current.nfa_states] = current
@@ -0,0 +1,51 @@
+from typing import Iterable, Iterator, Optional
+
+__all__ = ["LiteralMatcher"]
+
+
+class LiteralMatcher:
+    """
+    Matcher para expresiones que aceptan una única palabra (una
+    concatenación de caracteres, ver RegEx.literal_words), sin construir
+    ningún autómata: en modo match es una comparación de strings, y en modo
+    búsqueda usa str.find / in, cuya implementación en C ya es una búsqueda
+    con tabla de saltos (Boyer-Moore-Horspool) sobre la cadena. Funciona
+    igual con una palabra y cadenas de bytes (ver engines.compile_bytes).
+    """
+
+    def __init__(self, literal: str, search: bool = False):
+        self.literal = literal
+        self.search = search
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la cadena es la palabra (o, en modo búsqueda, si la
+        contiene).
+        """
+        return self.literal in word if self.search else word == self.literal
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si es la palabra (o si la contiene) (1) o no (0)."""
+        literal = self.literal
+        if self.search:
+            return bytearray(literal in word for word in words)
+        return bytearray(word == literal for word in words)
+
+    def spans(self, word: str) -> Iterator[tuple[int, int]]:
+        """
+        Devuelve, de izquierda a derecha, las apariciones de la palabra que no
+        se solapan, como pares (inicio, fin) (ver SpanMatcher.spans).
+        """
+        step = len(self.literal) or 1
+        start = word.find(self.literal)
+        while start >= 0:
+            yield start, start + len(self.literal)
+            start = word.find(self.literal, start + step)
+
+    def span(self, word: str) -> Optional[tuple[int, int]]:
+        """Devuelve (inicio, fin) de la primera aparición de la palabra, o None."""
+        return next(self.spans(word), None)
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el largo de la palabra."""
+        return {"literal_length": len(self.literal)}
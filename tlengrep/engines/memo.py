@@ -0,0 +1,63 @@
+from typing import Hashable, Iterable
+
+from regex import RegEx
+
+__all__ = ["MemoMatcher"]
+
+
+class MemoMatcher:
+    """
+    Matcher de referencia con la misma semántica que RegEx.naive_match, pero
+    resuelto por programación dinámica: cada subproblema (nodo, inicio, fin)
+    sobre la cadena original se calcula una única vez por cadena.
+
+    El tiempo es polinomial en el largo de la cadena (O(nodos · n³) en el peor
+    caso) y no se crean slices de la cadena. Los contadores son acumulativos
+    entre llamadas a match.
+
+    Si search es True, match indica si la expresión acepta alguna subcadena,
+    probando todos los pares (inicio, fin) sobre la misma tabla.
+    """
+
+    def __init__(self, regex: RegEx, search: bool = False):
+        self.regex = regex
+        self.search = search
+        self.cache_hits = 0
+        self.subproblems = 0
+        self._table = {}
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta la cadena dada (o, en modo
+        búsqueda, si acepta alguna subcadena).
+        """
+        self._word = word
+        self._table = {}
+        if self.search:
+            return any(self.solve(self.regex, start, end)
+                       for end in range(len(word) + 1) for start in range(end + 1))
+        return self.solve(self.regex, 0, len(word))
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si la expresión regular la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def solve(self, node: RegEx, start: int, end: int) -> bool:
+        """Indica si node acepta word[start:end], memoizando el resultado."""
+        key = (node, start, end)
+        if key in self._table:
+            self.cache_hits += 1
+            return self._table[key]
+        result = node._range_match(self._word, start, end, self)
+        self.store(node, start, end, result)
+        return result
+
+    def store(self, node: Hashable, start: int, end: int, result: bool):
+        """Registra el resultado de un subproblema ya resuelto."""
+        if (node, start, end) not in self._table:
+            self.subproblems += 1
+        self._table[(node, start, end)] = result
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve los contadores del matcher."""
+        return {"cache_hits": self.cache_hits, "subproblems": self.subproblems}
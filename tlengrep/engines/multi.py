@@ -0,0 +1,92 @@
+from automata import AFND
+from automata.afnd import SpecialSymbol
+from engines.lazydfa import LazyDFA
+
+__all__ = ["union_afnd", "MultiMatcher"]
+
+
+def union_afnd(afnds: list[AFND]) -> tuple[AFND, dict]:
+    """
+    Une varios AFND en uno solo: los estados del i-ésimo se renombran a
+    (i, estado) y un estado inicial nuevo va por λ a cada inicial. Devuelve
+    el AFND y las etiquetas de sus estados finales (estado -> i).
+    """
+    union = AFND()
+    union.add_state("start")
+    union.mark_initial_state("start")
+    tags = {}
+    for i, afnd in enumerate(afnds):
+        for state in afnd.states:
+            final = state in afnd.final_states
+            union.add_state((i, state), final)
+            if final:
+                tags[(i, state)] = i
+        for state, transitions in afnd.transitions.items():
+            for char, destinations in transitions.items():
+                for destination in destinations:
+                    union.add_transition((i, state), (i, destination), char)
+        union.add_transition("start", (i, afnd.initial_state), SpecialSymbol.Lambda)
+    return union, tags
+
+
+class MultiMatcher(LazyDFA):
+    """
+    Matcher de varios patrones a la vez sobre un único autómata: el AFD
+    perezoso (ver LazyDFA) de la unión de sus AFND (ver union_afnd), en el
+    que cada estado final sabe qué patrones acepta. Así cada cadena se
+    recorre una sola vez, sin importar la cantidad de patrones.
+
+    match indica si algún patrón matchea; matches devuelve cuáles. En modo
+    búsqueda, se recorre la cadena hasta encontrar todos los patrones o
+    llegar al final, juntando los patrones de cada estado final alcanzado.
+    """
+
+    def __init__(self, afnds: list[AFND], max_states: int = 1024, search: bool = False):
+        afnd, tags = union_afnd(afnds)
+        super().__init__(afnd, max_states, search)
+        self.patterns = len(afnds)
+        self.tags = [tags.get(state) for state in self.nfa.states]
+        # Conjunto de estados del AFND -> patrones que acepta
+        self._accepted = {}
+
+    def matches(self, word: str) -> list[int]:
+        """Devuelve los índices (ordenados) de los patrones que matchean la cadena."""
+        state = self._start
+        search = self.search
+        found = set(self._accepted_by(state)) if search and state.accepting else set()
+        for char in word:
+            if search and len(found) == self.patterns:
+                break
+            next = state.transitions.get(char)
+            if next is None:
+                next = self._step(state, char)
+            else:
+                self.cache_hits += 1
+            if not next.nfa_states:
+                return []
+            state = next
+            if search and state.accepting:
+                found.update(self._accepted_by(state))
+        if not search and state.accepting:
+            found.update(self._accepted_by(state))
+        return sorted(found)
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve las estadísticas del caché de estados y la cantidad de patrones."""
+        stats = super().stats()
+        stats["patterns"] = self.patterns
+        return stats
+
+    def _accepted_by(self, state) -> frozenset[int]:
+        """(Interno) Devuelve (memoizado) los patrones que acepta un estado del AFD."""
+        accepted = self._accepted.get(state.nfa_states)
+        if accepted is None:
+            tags = self.tags
+            accepted = frozenset(tags[nfa_state] for nfa_state in state.nfa_states if tags[nfa_state] is not None)
+            self._accepted[state.nfa_states] = accepted
+        return accepted
+
+    def _flush(self, current):
+        """Vacía el caché de estados y el de patrones aceptados."""
+        super()._flush(current)
+        self._accepted = {}
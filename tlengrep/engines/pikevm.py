@@ -0,0 +1,161 @@
+from typing import Iterable
+
+from automata import AFND, CharSet
+from automata.afnd import SpecialSymbol
+from automata.ranges import SymbolMap, minterms
+
+__all__ = ["SparseSet", "PikeVM"]
+
+
+class SparseSet:
+    """
+    Conjunto de enteros en [0, capacity) con alta, pertenencia y vaciado en
+    O(1) (representación de Briggs y Torczon). Los elementos se recorren en
+    orden de inserción.
+    """
+
+    def __init__(self, capacity: int):
+        self.dense = [0] * capacity
+        self.sparse = [0] * capacity
+        self.size = 0
+
+    def add(self, value: int):
+        """Agrega un elemento al conjunto (no hace nada si ya pertenece)."""
+        index = self.sparse[value]
+        if index < self.size and self.dense[index] == value:
+            return
+        self.sparse[value] = self.size
+        self.dense[self.size] = value
+        self.size += 1
+
+    def clear(self):
+        """Vacía el conjunto."""
+        self.size = 0
+
+    def __contains__(self, value: int) -> bool:
+        index = self.sparse[value]
+        return index < self.size and self.dense[index] == value
+
+    def __iter__(self):
+        return iter(self.dense[:self.size])
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class PikeVM:
+    """
+    Simulación de un AFND en paralelo (Thompson / Pike VM).
+
+    El autómata se compila a un programa plano: los estados se numeran
+    0, 1, 2, ... y cada instrucción guarda, para cada carácter, los estados
+    destino directos, y aparte las transiciones λ de cada estado. Durante la
+    simulación se avanzan todos los estados activos a la vez sobre dos
+    SparseSet, siguiendo las transiciones λ al agregar cada estado; el
+    SparseSet hace de conjunto de visitados, así que cada estado se agrega
+    (y cada transición se recorre) a lo sumo una vez por carácter, y cada
+    carácter de la cadena cuesta O(estados + transiciones) operaciones, sin
+    importar la forma del patrón.
+
+    Si search es True, match busca el patrón en cualquier parte de la cadena
+    (como grep): antes de cada carácter se vuelven a activar los estados
+    iniciales, como si el patrón empezara con Σ*, y la simulación termina en
+    la primera posición en la que se activa un estado final.
+
+    Si el AFND tiene transiciones por CharSet, las instrucciones se indexan
+    por los mintérminos del alfabeto (ver automata.ranges.minterms) y cada
+    carácter de la cadena se traduce a su mintérmino con un SymbolMap.
+    """
+
+    def __init__(self, afnd: AFND, search: bool = False):
+        states = [afnd.initial_state] + sorted(afnd.states - {afnd.initial_state}, key=str)
+        number = {state: i for i, state in enumerate(states)}
+
+        self.search = search
+        # Estados del AFND, en el orden de su numeración
+        self.states = states
+        self.size = len(states)
+        self.accepting = [state in afnd.final_states for state in states]
+        symbols = minterms(afnd.alphabet)
+        # Traducción carácter -> mintérmino (None si no hay clases de caracteres)
+        self.symbols = SymbolMap(symbol for symbol, _ in symbols) \
+            if any(isinstance(char, CharSet) for char in afnd.alphabet) else None
+        # Etiqueta -> mintérminos que contiene
+        contained = {}
+        for symbol, labels in symbols:
+            for label in labels:
+                contained.setdefault(label, []).append(symbol)
+        self.program = []
+        # Destinos de las transiciones λ de cada estado
+        self.lambdas = []
+        for state in states:
+            instruction = {}
+            for char, destinations in afnd.transitions[state].items():
+                if char is SpecialSymbol.Lambda:
+                    continue
+                for symbol in contained.get(char, ()):
+                    targets = instruction.setdefault(symbol, {})
+                    targets.update(dict.fromkeys(number[destination] for destination in destinations))
+            self.program.append({symbol: tuple(targets) for symbol, targets in instruction.items()})
+            self.lambdas.append(tuple(sorted(number[destination] for destination in
+                                             afnd.transitions[state].get(SpecialSymbol.Lambda, ()))))
+
+        self._current = SparseSet(self.size)
+        self._next = SparseSet(self.size)
+        # Clausura λ del estado inicial
+        self.add_closure(self._current, (0,))
+        self.start = tuple(self._current)
+
+    def add_closure(self, active: SparseSet, targets):
+        """
+        Agrega a active los estados dados y los que se alcanzan desde ellos por
+        transiciones λ. Los estados que ya están en active no se vuelven a
+        recorrer.
+        """
+        lambdas = self.lambdas
+        stack = list(targets)
+        while stack:
+            state = stack.pop()
+            if state not in active:
+                active.add(state)
+                stack.extend(lambdas[state])
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si el autómata acepta la cadena dada (o, en modo búsqueda, si
+        acepta alguna subcadena).
+        """
+        current, next = self._current, self._next
+        program, accepting, start, search = self.program, self.accepting, self.start, self.search
+        symbols, add_closure = self.symbols, self.add_closure
+        current.clear()
+        for state in start:
+            current.add(state)
+
+        for char in word:
+            if search and any(accepting[state] for state in current):
+                return True
+            if symbols is not None:
+                char = symbols[char]
+            next.clear()
+            for state in current:
+                targets = program[state].get(char)
+                if targets:
+                    add_closure(next, targets)
+            if search:
+                for state in start:
+                    next.add(state)
+            elif not next:
+                return False
+            current, next = next, current
+
+        return any(accepting[state] for state in current)
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si el autómata la acepta (1) o no (0)."""
+        return bytearray(map(self.match, words))
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del programa compilado."""
+        return {"states": self.size,
+                "instructions": sum(len(instruction) for instruction in self.program)}
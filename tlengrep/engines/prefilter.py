@@ -0,0 +1,98 @@
+from typing import Iterable
+
+from engines.utf8 import utf8_edge_bytes
+from regex import RegEx
+
+__all__ = ["Prefilter"]
+
+
+class Prefilter:
+    """
+    Filtro previo a un matcher, que rechaza sin ejecutarlo las cadenas que
+    la expresión regular no puede aceptar:
+    - por largo o por su primer o último carácter (ver RegEx.bounds);
+    - por no empezar con el prefijo, no terminar con el sufijo o no contener
+      el factor obligatorios (ver RegEx.literals), con str.startswith,
+      str.endswith e in.
+    Si la expresión acepta una única cadena, se compara directamente.
+
+    En modo búsqueda (search es True) solo se exige el largo mínimo y que
+    los literales obligatorios aparezcan en alguna parte de la cadena.
+
+    Si binary es True, las cadenas son bytes en UTF-8 (ver ByteDFA): los
+    literales se codifican, los largos se cuentan en bytes (de 1 a 4 por
+    carácter) y el primer y último carácter se comparan por sus bytes.
+    """
+
+    def __init__(self, regex: RegEx, matcher, search: bool = False, binary: bool = False):
+        self.matcher = matcher
+        self.search = search
+        self.rejects = 0
+        literals = regex.literals()
+        bounds = regex.bounds()
+        self.empty = literals is None
+        if self.empty:
+            self.prefix = self.suffix = self.factor = self.exact = None
+            return
+        self.min_length = bounds.min_length
+        self.max_length = bounds.max_length if bounds.max_length is not None else float("inf")
+        self.first_chars = bounds.first_chars
+        self.last_chars = bounds.last_chars
+        self.exact = literals.exact
+        self.prefix = literals.prefix
+        self.suffix = literals.suffix
+        # El factor solo aporta si no está incluido en el prefijo o el sufijo
+        self.factor = "" if literals.factor in self.prefix or literals.factor in self.suffix else literals.factor
+        if binary:
+            self.max_length *= 4
+            self.first_chars = utf8_edge_bytes(self.first_chars)[0]
+            self.last_chars = utf8_edge_bytes(self.last_chars)[1]
+            self.exact = self.exact.encode() if self.exact is not None else None
+            self.prefix, self.suffix, self.factor = self.prefix.encode(), self.suffix.encode(), self.factor.encode()
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta la cadena dada (o, en modo
+        búsqueda, si acepta alguna subcadena).
+        """
+        if self.exact is not None:
+            return self.exact in word if self.search else word == self.exact
+        if not self._passes(word):
+            self.rejects += 1
+            return False
+        return self.matcher.match(word)
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """
+        Indica, para cada cadena, si la expresión regular la acepta (1) o no
+        (0). Las cadenas que pasan el filtro se matchean en un único lote.
+        """
+        words = list(words)
+        results = bytearray(len(words))
+        if self.exact is not None:
+            for i, word in enumerate(words):
+                results[i] = self.exact in word if self.search else word == self.exact
+            return results
+        passes = self._passes
+        indices = [i for i, word in enumerate(words) if passes(word)]
+        self.rejects += len(words) - len(indices)
+        for i, matched in zip(indices, self.matcher.match_many([words[i] for i in indices])):
+            results[i] = matched
+        return results
+
+    def _passes(self, word: str) -> bool:
+        """(Interno) Indica si la cadena pasa el filtro."""
+        if self.empty:
+            return False
+        if self.search:
+            return len(word) >= self.min_length and self.prefix in word and self.suffix in word \
+                and self.factor in word
+        return self.min_length <= len(word) <= self.max_length \
+            and (not word or word[0] in self.first_chars and word[-1] in self.last_chars) \
+            and word.startswith(self.prefix) and word.endswith(self.suffix) and self.factor in word
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve las estadísticas del matcher, junto con las del filtro."""
+        stats = self.matcher.stats()
+        stats["prefilter_rejects"] = self.rejects
+        return stats
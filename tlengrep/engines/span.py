@@ -0,0 +1,104 @@
+from typing import Iterator, Optional
+
+from automata import AFD, AFND, CharSet
+from automata.ranges import SymbolMap
+
+__all__ = ["SpanMatcher"]
+
+
+class SpanMatcher:
+    """
+    Búsqueda de las apariciones de un patrón con la semántica leftmost-longest
+    (la que empieza más a la izquierda y, entre esas, la más larga), sin
+    backtracking, con dos AFD:
+    - uno de Σ*·reverso(L) (ver AFND.reverse y AFND.determinize), que recorre
+      la cadena de derecha a izquierda una única vez y está en un estado final
+      en la posición i si y solo si alguna aparición empieza en i;
+    - uno de L, que desde cada inicio encontrado avanza hacia la derecha
+      recordando la última posición final, hasta llegar a un estado muerto.
+
+    Si el patrón tiene clases de caracteres, los caracteres se traducen a los
+    mintérminos del alfabeto de los AFD con un SymbolMap.
+    """
+
+    def __init__(self, afnd: AFND):
+        forward = afnd.determinize().minimize()
+        self.forward, self.forward_accepting = self._compile(forward)
+        self.reverse, self.reverse_accepting = self._compile(afnd.reverse().determinize(search=True).minimize())
+        # Los dos AFD tienen los mintérminos del AFND como alfabeto
+        self.symbols = SymbolMap(forward.alphabet) \
+            if any(isinstance(char, CharSet) for char in afnd.alphabet) else None
+
+    def span(self, word: str) -> Optional[tuple[int, int]]:
+        """
+        Devuelve (inicio, fin) de la aparición leftmost-longest del patrón en
+        la cadena, o None si no aparece.
+        """
+        return next(self.spans(word), None)
+
+    def spans(self, word: str) -> Iterator[tuple[int, int]]:
+        """
+        Devuelve, de izquierda a derecha, las apariciones leftmost-longest del
+        patrón que no se solapan, como pares (inicio, fin). Después de una
+        aparición vacía se avanza un carácter.
+        """
+        starts = self._starts(word)
+        position = 0
+        while position <= len(word):
+            start = starts.find(1, position)
+            if start < 0:
+                return
+            end = self._longest_end(word, start)
+            yield start, end
+            position = end if end > start else end + 1
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve la cantidad de estados de cada AFD."""
+        return {"forward_states": len(self.forward), "reverse_states": len(self.reverse)}
+
+    def _starts(self, word: str) -> bytearray:
+        """
+        (Interno) Recorre la cadena de derecha a izquierda con el AFD reverso.
+        Devuelve un bytearray con un 1 en cada posición en la que empieza
+        alguna aparición del patrón. Los caracteres fuera del alfabeto vuelven
+        al estado inicial.
+        """
+        transitions, accepting, symbols = self.reverse, self.reverse_accepting, self.symbols
+        starts = bytearray(len(word) + 1)
+        state = 0
+        starts[len(word)] = accepting[state]
+        for i in range(len(word) - 1, -1, -1):
+            char = word[i] if symbols is None else symbols[word[i]]
+            state = transitions[state].get(char, 0)
+            starts[i] = accepting[state]
+        return starts
+
+    def _longest_end(self, word: str, start: int) -> int:
+        """
+        (Interno) Devuelve el fin de la aparición más larga que empieza en
+        start (que debe existir).
+        """
+        transitions, accepting, symbols = self.forward, self.forward_accepting, self.symbols
+        state = 0
+        end = start
+        for i in range(start, len(word)):
+            char = word[i] if symbols is None else symbols[word[i]]
+            state = transitions[state].get(char)
+            if state is None:
+                break
+            if accepting[state]:
+                end = i + 1
+        return end
+
+    @staticmethod
+    def _compile(afd: AFD) -> tuple[list[dict[str, int]], list[bool]]:
+        """
+        (Interno) Numera los estados del AFD (0 es el inicial) y devuelve sus
+        transiciones (sin las que van a estados muertos) y sus estados finales.
+        """
+        states = [afd.initial_state] + sorted(afd.states - {afd.initial_state}, key=str)
+        numbers = {state: i for i, state in enumerate(states)}
+        dead_states = afd.dead_states()
+        transitions = [{char: numbers[next_state] for char, next_state in afd.transitions[state].items()
+                        if next_state not in dead_states} for state in states]
+        return transitions, [state in afd.final_states for state in states]
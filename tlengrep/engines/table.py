@@ -0,0 +1,174 @@
+from array import array
+from typing import Iterable
+
+from automata import AFD
+from automata.ranges import SymbolMap
+
+__all__ = ["TableDFA"]
+
+
+class _ClassMap(dict):
+    """
+    (Interno) Tabla para str.translate: código de carácter -> id de su clase.
+    Los caracteres que no son etiquetas del alfabeto se agregan la primera vez
+    que aparecen, con la clase del CharSet que los contiene (buscado con un
+    SymbolMap) o, si no hay ninguno, con la clase "otros".
+    """
+
+    def __init__(self, classes: list[list], other: int):
+        super().__init__({ord(char): i for i, chars in enumerate(classes) for char in chars
+                          if isinstance(char, str)})
+        self.other = other
+        self.columns = {char: i for i, chars in enumerate(classes) for char in chars if not isinstance(char, str)}
+        self.symbols = SymbolMap(self.columns)
+
+    def __missing__(self, key: int) -> int:
+        column = self.columns.get(self.symbols[chr(key)], self.other)
+        self[key] = column
+        return column
+
+
+# Valores especiales de la tabla de transiciones
+DEAD = -1
+UNIVERSAL = -2
+
+
+class TableDFA:
+    """
+    AFD compilado a una tabla de transiciones plana.
+
+    Los estados se renumeran a enteros 0, 1, 2, ... (0 es el inicial) y el
+    alfabeto (caracteres y CharSet) se agrupa en clases de equivalencia (ver
+    AF.alphabet_classes), una columna por clase; los caracteres fuera del
+    alfabeto comparten una última columna sin transiciones. La tabla es un array('i') indexado por
+    estado * columnas + columna, y guarda directamente el índice de la fila
+    destino (estado * columnas).
+
+    Al construir la tabla se clasifican los estados: las transiciones a un
+    estado muerto (desde el que no se alcanza ningún final) se guardan como
+    DEAD, y las transiciones a un estado universal (final, y tal que toda
+    continuación también es final) como UNIVERSAL. Así, el matching termina
+    apenas la cadena queda decidida, sin recorrer el resto.
+
+    Cada cadena se traduce a ids de clase con una única llamada a
+    str.translate, así que el ciclo de matching es solo un acceso al array
+    por carácter.
+
+    Si search es True, el AFD debe ser el de Σ*L (ver AFND.determinize): los
+    caracteres fuera del alfabeto vuelven al estado inicial y todos los
+    estados finales se tratan como universales, así que el matching termina
+    en la primera posición en la que se encuentra el patrón.
+    """
+
+    def __init__(self, afd: AFD, search: bool = False):
+        states = [afd.initial_state] + sorted(afd.states - {afd.initial_state}, key=str)
+        self.size = len(states)
+        self.classes = afd.alphabet_classes()
+        self.other = len(self.classes)
+        width = len(self.classes) + 1
+        rows = {state: i * width for i, state in enumerate(states)}
+
+        self.class_map = _ClassMap(self.classes, self.other)
+        # Con menos de 256 clases, la cadena traducida se codifica a bytes
+        self.encoding = "latin-1" if width <= 256 else "utf-32-le"
+
+        self.table = array('i', [DEAD]) * (self.size * width)
+        self.accepting = bytearray(self.size * width)
+        for state in states:
+            row = rows[state]
+            self.accepting[row] = state in afd.final_states
+            for column, chars in enumerate(self.classes):
+                if chars[0] in afd.transitions[state]:
+                    self.table[row + column] = rows[afd.transitions[state][chars[0]]]
+            if search:
+                self.table[row + self.other] = 0
+
+        self.dead_rows = {rows[state] for state in afd.dead_states()}
+        if search:
+            self.universal_rows = {row for row in range(0, len(self.table), width) if self.accepting[row]}
+        else:
+            self.universal_rows = self._universal_rows(width)
+        for i, next_row in enumerate(self.table):
+            if next_row in self.dead_rows:
+                self.table[i] = DEAD
+            elif next_row in self.universal_rows:
+                self.table[i] = UNIVERSAL
+        self.start = 0
+        if 0 in self.dead_rows:
+            self.start = DEAD
+        elif 0 in self.universal_rows:
+            self.start = UNIVERSAL
+        self.early_exits = 0
+
+    def translate(self, word: str):
+        """Traduce la cadena a la secuencia de ids de clase de sus caracteres."""
+        encoded = word.translate(self.class_map).encode(self.encoding)
+        if self.encoding == "latin-1":
+            return encoded
+        return memoryview(encoded).cast('I')
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si el autómata acepta la cadena dada (o, en modo búsqueda, si
+        acepta alguna subcadena).
+        """
+        table = self.table
+        row = self.start
+        if row < 0:
+            return row == UNIVERSAL
+        for column in self.translate(word):
+            row = table[row + column]
+            if row < 0:
+                self.early_exits += 1
+                return row == UNIVERSAL
+        return self.accepting[row] == 1
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """
+        Indica, para cada cadena, si el autómata la acepta (1) o no (0).
+        Todas las cadenas se traducen a ids de clase con una única llamada a
+        str.translate sobre su concatenación.
+        """
+        words = list(words)
+        return self._match_joined(words, "".join(words))
+
+    def _match_joined(self, words: list, joined) -> bytearray:
+        """(Interno) Matchea el lote de cadenas, dada su concatenación joined."""
+        table, accepting, start = self.table, self.accepting, self.start
+        results = bytearray(len(words))
+        if start < 0:
+            return bytearray([start == UNIVERSAL]) * len(words)
+        columns = memoryview(self.translate(joined))
+        end = 0
+        for i, word in enumerate(words):
+            begin, end = end, end + len(word)
+            row = start
+            for column in columns[begin:end]:
+                row = table[row + column]
+                if row < 0:
+                    self.early_exits += 1
+                    break
+            results[i] = row == UNIVERSAL if row < 0 else accepting[row]
+        return results
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño de la tabla y la clasificación de los estados."""
+        return {"states": self.size, "columns": len(self.classes) + 1, "table_size": len(self.table),
+                "dead_states": len(self.dead_rows), "universal_states": len(self.universal_rows),
+                "early_exits": self.early_exits}
+
+    def _universal_rows(self, width: int) -> set[int]:
+        """
+        Calcula las filas de los estados universales: el mayor conjunto de
+        estados finales cuyas transiciones (para todas las columnas) están
+        definidas y llevan a estados del mismo conjunto.
+        """
+        universal = {row for row in range(0, len(self.table), width) if self.accepting[row]}
+        changed = True
+        while changed:
+            changed = False
+            for row in list(universal):
+                if any(self.table[row + column] not in universal for column in range(width)):
+                    universal.remove(row)
+                    changed = True
+        return universal
@@ -0,0 +1,151 @@
+from typing import Iterable, Iterator, Union
+
+from automata import AFD, AFND, CharSet
+from automata.afnd import SpecialSymbol
+from automata.ranges import SURROGATES
+from engines.table import TableDFA
+
+__all__ = ["utf8_sequences", "utf8_afnd", "utf8_edge_bytes", "ByteDFA"]
+
+
+# Mayor código de carácter que se codifica con 1, 2 y 3 bytes
+_UTF8_MAX = (0x7F, 0x7FF, 0xFFFF)
+
+
+def utf8_sequences(lo: int, hi: int) -> Iterator[tuple[tuple[int, int], ...]]:
+    """
+    Parte el intervalo de códigos [lo, hi] en secuencias de intervalos de
+    bytes: la codificación UTF-8 de cada carácter del intervalo es aceptada
+    por exactamente una secuencia (un intervalo de bytes por byte), y cada
+    secuencia acepta solo codificaciones de caracteres del intervalo. Los
+    surrogates se omiten.
+
+    Por ejemplo, [U+0080, U+07FF] es la única secuencia [C2-DF][80-BF].
+    """
+    ranges_to_split = [(lo, hi)]
+    while ranges_to_split:
+        lo, hi = ranges_to_split.pop()
+        if lo <= SURROGATES[1] and hi >= SURROGATES[0]:
+            if hi > SURROGATES[1]:
+                ranges_to_split.append((SURROGATES[1] + 1, hi))
+            if lo < SURROGATES[0]:
+                ranges_to_split.append((lo, SURROGATES[0] - 1))
+            continue
+
+        # Partimos en los cambios de largo de la codificación
+        for maximum in _UTF8_MAX:
+            if lo <= maximum < hi:
+                ranges_to_split.append((maximum + 1, hi))
+                ranges_to_split.append((lo, maximum))
+                break
+        else:
+            # Partimos hasta que los bytes de continuación de cada mitad
+            # recorran todo [80, BF] o coincidan en los dos extremos
+            for i in range(1, 4):
+                mask = (1 << (6 * i)) - 1
+                if lo & ~mask != hi & ~mask:
+                    if lo & mask != 0:
+                        ranges_to_split.append(((lo | mask) + 1, hi))
+                        ranges_to_split.append((lo, lo | mask))
+                        break
+                    if hi & mask != mask:
+                        ranges_to_split.append((hi & ~mask, hi))
+                        ranges_to_split.append((lo, (hi & ~mask) - 1))
+                        break
+            else:
+                yield tuple(zip(chr(lo).encode(), chr(hi).encode()))
+
+
+def _byte_label(lo: int, hi: int) -> Union[str, CharSet]:
+    """(Interno) Etiqueta de un intervalo de bytes: los bytes son los caracteres U+0000 a U+00FF."""
+    return chr(lo) if lo == hi else CharSet([(lo, hi)])
+
+
+def _intervals(label) -> tuple[tuple[int, int], ...]:
+    """(Interno) Intervalos de códigos de una etiqueta (un carácter o un CharSet)."""
+    return label.ranges if isinstance(label, CharSet) else ((ord(label), ord(label)),)
+
+
+def utf8_afnd(afnd: AFND) -> AFND:
+    """
+    Convierte un AFND sobre caracteres en uno equivalente sobre los bytes de
+    su codificación UTF-8: cada byte es una etiqueta (el carácter de código
+    igual al byte, o un CharSet para un intervalo de bytes), y cada
+    transición por un carácter o CharSet pasa a ser un camino por las
+    secuencias de utf8_sequences, con estados intermedios nuevos. Los
+    caminos que salen de un mismo estado comparten sus prefijos.
+
+    El AFND resultante no acepta ninguna cadena de bytes que no sea UTF-8
+    válido.
+    """
+    utf8 = AFND()
+    for state in afnd.states:
+        utf8.add_state(state, state in afnd.final_states)
+    utf8.mark_initial_state(afnd.initial_state)
+
+    for state, transitions in afnd.transitions.items():
+        # Prefijo de intervalos de bytes -> estado intermedio
+        prefixes = {(): state}
+        for char, destinations in transitions.items():
+            if char is SpecialSymbol.Lambda:
+                for destination in destinations:
+                    utf8.add_transition(state, destination, char)
+                continue
+            for lo, hi in _intervals(char):
+                for sequence in utf8_sequences(lo, hi):
+                    current = state
+                    for i in range(1, len(sequence)):
+                        next = prefixes.get(sequence[:i])
+                        if next is None:
+                            next = prefixes[sequence[:i]] = ("utf8", state, sequence[:i])
+                            utf8.add_state(next)
+                            utf8.add_transition(current, next, _byte_label(*sequence[i - 1]))
+                        current = next
+                    for destination in destinations:
+                        utf8.add_transition(current, destination, _byte_label(*sequence[-1]))
+    return utf8
+
+
+def utf8_edge_bytes(chars: Union[frozenset, CharSet]) -> tuple[frozenset[int], frozenset[int]]:
+    """
+    Devuelve los conjuntos de primeros y últimos bytes de las codificaciones
+    UTF-8 de los caracteres dados (un conjunto de caracteres o un CharSet).
+    """
+    intervals = chars.ranges if isinstance(chars, CharSet) else [(ord(char), ord(char)) for char in chars]
+    first, last = set(), set()
+    for lo, hi in intervals:
+        for sequence in utf8_sequences(lo, hi):
+            first.update(range(sequence[0][0], sequence[0][1] + 1))
+            last.update(range(sequence[-1][0], sequence[-1][1] + 1))
+    return frozenset(first), frozenset(last)
+
+
+class ByteDFA(TableDFA):
+    """
+    AFD compilado a tabla (ver TableDFA) que matchea cadenas de bytes en
+    lugar de strings: el AFD debe ser sobre bytes (ver utf8_afnd), y cada
+    cadena se traduce a ids de clase con una única llamada a bytes.translate,
+    sin decodificarla. Las cadenas que no son UTF-8 válido no matchean (o, en
+    modo búsqueda, matchean solo si alguna parte válida contiene el patrón),
+    en lugar de producir un error.
+    """
+
+    def __init__(self, afd: AFD, search: bool = False):
+        if any(max(_intervals(char))[1] > 0xFF for char in afd.alphabet):
+            raise ValueError("El AFD de un ByteDFA debe ser sobre bytes (ver utf8_afnd).")
+        super().__init__(afd, search)
+        # Hay a lo sumo 256 clases, así que los ids de clase entran en un byte
+        self.byte_map = bytes(self.class_map[byte] for byte in range(256))
+
+    def translate(self, word: bytes) -> bytes:
+        """Traduce la cadena de bytes a la secuencia de ids de clase de sus bytes."""
+        return word.translate(self.byte_map)
+
+    def match_many(self, words: Iterable[bytes]) -> bytearray:
+        """
+        Indica, para cada cadena de bytes, si el autómata la acepta (1) o no
+        (0). Todas las cadenas se traducen con una única llamada a
+        bytes.translate sobre su concatenación.
+        """
+        words = list(words)
+        return self._match_joined(words, b"".join(words))
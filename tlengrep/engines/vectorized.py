@@ -0,0 +1,88 @@
+from typing import Iterable
+
+from automata import AFD
+from engines.table import _ClassMap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ["VectorizedDFA"]
+
+
+class VectorizedDFA:
+    """
+    AFD simulado con NumPy sobre un lote de cadenas a la vez.
+
+    La matriz de transiciones tiene una fila por estado (0 es el inicial, y
+    se agrega un estado trampa para los caracteres sin transición) y una
+    columna por clase de equivalencia del alfabeto (ver AF.alphabet_classes),
+    más una columna "otros" y una de relleno. Las cadenas del lote se
+    traducen a ids de clase y se acomodan en un array 2-D, completando las
+    más cortas con la columna de relleno, que deja cada estado en sí mismo:
+    así las cadenas que ya terminaron no cambian de estado. Cada paso avanza
+    el vector de estados de todo el lote con un único acceso indexado.
+
+    Conviene para lotes de cadenas cortas y de largo parecido. Requiere NumPy.
+
+    Si search es True, el AFD debe ser el de Σ*L (ver AFND.determinize): los
+    caracteres fuera del alfabeto vuelven al estado inicial y los estados
+    finales pasan a ser absorbentes, de modo que una cadena que contiene el
+    patrón termina en un estado final.
+    """
+
+    def __init__(self, afd: AFD, search: bool = False):
+        if np is None:
+            raise ImportError("El motor vectorizado requiere NumPy (pip install numpy).")
+        states = [afd.initial_state] + sorted(afd.states - {afd.initial_state}, key=str)
+        self.size = len(states)
+        self.classes = afd.alphabet_classes()
+        self.other = len(self.classes)
+        self.padding = self.other + 1
+        numbers = {state: i for i, state in enumerate(states)}
+        trap = self.size
+
+        self.class_map = _ClassMap(self.classes, self.other)
+        self.encoding = "latin-1" if self.padding < 256 else "utf-32-le"
+        self.dtype = np.uint8 if self.encoding == "latin-1" else np.uint32
+
+        self.transitions = np.full((self.size + 1, self.padding + 1), trap, dtype=np.intp)
+        for state in states:
+            for column, chars in enumerate(self.classes):
+                if chars[0] in afd.transitions[state]:
+                    self.transitions[numbers[state], column] = numbers[afd.transitions[state][chars[0]]]
+        if search:
+            self.transitions[:, self.other] = 0
+        self.accepting = np.zeros(self.size + 1, dtype=bool)
+        for state in afd.final_states:
+            self.accepting[numbers[state]] = True
+            if search:
+                self.transitions[numbers[state]] = numbers[state]
+        self.transitions[:, self.padding] = np.arange(self.size + 1)
+
+    def match(self, word: str) -> bool:
+        """
+        Indica si el autómata acepta la cadena dada (o, en modo búsqueda, si
+        acepta alguna subcadena).
+        """
+        return self.match_many([word])[0] == 1
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """Indica, para cada cadena, si el autómata la acepta (1) o no (0)."""
+        words = list(words)
+        lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+        width = int(lengths.max()) if len(words) else 0
+        columns = np.full((len(words), width), self.padding, dtype=self.dtype)
+        encoded = "".join(words).translate(self.class_map).encode(self.encoding)
+        columns[np.arange(width) < lengths[:, None]] = np.frombuffer(encoded, dtype=self.dtype)
+
+        transitions = self.transitions
+        states = np.zeros(len(words), dtype=np.intp)
+        for column in columns.T:
+            states = transitions[states, column]
+        return bytearray(self.accepting[states].tobytes())
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño de la matriz de transiciones."""
+        return {"states": self.size, "columns": self.padding + 1, "matrix_size": self.transitions.size}
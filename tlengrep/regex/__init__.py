@@ -1,22 +1,118 @@
 from abc import ABC, abstractmethod
+import weakref
+from typing import Iterable, Iterator, Optional
+from typing import Union as Union_
 
-from automata import AFND
+from automata import AFND, CharSet
+from automata.afnd import SpecialSymbol
+from automata.ranges import minterms
 
 __all__ = [
     "RegEx",
     "Empty",
     "Lambda",
     "Char",
+    "CharClass",
     "Union",
     "Concat",
     "Star",
-    "Plus"
+    "Plus",
+    "Repeat",
+    "PositionAutomaton",
+    "Literals",
+    "Bounds"
 ]
 
 
+class PositionAutomaton:
+    """
+    Autómata de posiciones (Glushkov) de una expresión regular. Cada aparición
+    de un carácter en la expresión es una posición 1, 2, ..., y la posición 0
+    es el estado inicial. Los conjuntos de posiciones se representan como
+    enteros usados como vectores de bits (el bit p corresponde a la posición p).
+    """
+
+    def __init__(self):
+        # chars[p] es el carácter (o el CharSet) de la posición p (None para la posición 0)
+        self.chars = [None]
+        # follow[p] son las posiciones que pueden seguir a p (follow[0] = first)
+        self.follow = [0]
+        # final son las posiciones en las que puede terminar una cadena aceptada
+        self.final = 0
+
+    def size(self) -> int:
+        """Devuelve la cantidad de posiciones (incluyendo la inicial)."""
+        return len(self.chars)
+
+    def add_position(self, char: Union_[str, CharSet]) -> int:
+        """Agrega una posición para char (un carácter o un CharSet) y devuelve su bit."""
+        self.chars.append(char)
+        self.follow.append(0)
+        return 1 << (len(self.chars) - 1)
+
+    def link(self, last: int, first: int):
+        """Agrega first al follow de cada posición de last."""
+        while last:
+            bit = last & -last
+            self.follow[bit.bit_length() - 1] |= first
+            last ^= bit
+
+
+class Literals:
+    """
+    Literales obligatorios de una expresión regular: toda cadena aceptada
+    empieza con prefix, termina con suffix y contiene a factor. Si la
+    expresión acepta una única cadena, exact es esa cadena (y si no, None).
+    """
+
+    def __init__(self, prefix: str, suffix: str, factor: str, exact: str = None):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.factor = factor
+        self.exact = exact
+
+    @staticmethod
+    def of_word(word: str) -> "Literals":
+        """Literales de una expresión que acepta únicamente word."""
+        return Literals(word, word, word, word)
+
+
+class Bounds:
+    """
+    Cotas de las cadenas aceptadas por una expresión regular: su largo está
+    entre min_length y max_length (None si no está acotado), y las cadenas no
+    vacías empiezan con un carácter de first_chars y terminan con uno de
+    last_chars (conjuntos de caracteres, o CharSet si hay clases).
+    """
+
+    def __init__(self, min_length: int, max_length: int, first_chars: Union_[frozenset, CharSet],
+                 last_chars: Union_[frozenset, CharSet]):
+        self.min_length = min_length
+        self.max_length = max_length
+        self.first_chars = first_chars
+        self.last_chars = last_chars
+
+
 class RegEx(ABC):
     """Clase abstracta para representar expresiones regulares."""
 
+    # Matcher compilado por match (se construye en el primer uso)
+    _matcher = None
+    # Matcher compilado en modo búsqueda por search (se construye en el primer uso)
+    _searcher = None
+    # Buscador de apariciones de search_span (se construye en el primer uso)
+    _spanner = None
+    # Hash estructural (se calcula en el primer uso)
+    _hash = None
+    # Literales obligatorios (se calculan en el primer uso)
+    _literals = None
+    # Cotas de largo y de primer y último carácter (se calculan en el primer uso)
+    _bounds = None
+    # Palabras de una unión de literales (se calculan en el primer uso)
+    _words = None
+    # Tamaño con las repeticiones acotadas desenrolladas (se calcula en el primer uso)
+    _unrolled = None
+
     @abstractmethod
     def naive_match(self, word: str) -> bool:
         """
@@ -25,15 +121,342 @@ class RegEx(ABC):
         """
         pass
 
+    def memo_match(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta la cadena dada.
+        Misma semántica que naive_match, pero con programación dinámica sobre
+        subproblemas (nodo, inicio, fin): tiempo polinomial y sin slicing.
+        """
+        from engines import MemoMatcher
+        return MemoMatcher(self).match(word)
+
+    def compile(self, engine: str = "pikevm", construction: str = "thompson", search: bool = False):
+        """
+        Compila la expresión regular con el motor indicado (ver
+        engines.ENGINES), construyendo el AFND con construction si el motor lo
+        necesita (ver engines.CONSTRUCTIONS). Devuelve un objeto con los métodos
+        match(word) y match_many(words); si search es True, estos indican si
+        la expresión acepta alguna subcadena (ver search).
+        """
+        from engines import compile_regex
+        return compile_regex(self, engine, construction, search)
+
     def match(self, word: str) -> bool:
         """Indica si la expresión regular acepta la cadena dada."""
-        raise NotImplementedError
+        if self._matcher is None:
+            self._matcher = self.compile()
+        return self._matcher.match(word)
+
+    def match_many(self, words: Iterable[str]) -> bytearray:
+        """
+        Indica, para cada cadena (de una lista o cualquier otro iterable, como
+        un archivo abierto), si la expresión regular la acepta (1) o no (0). El
+        costo fijo de cada llamada se paga una vez por lote.
+        """
+        if self._matcher is None:
+            self._matcher = self.compile()
+        return self._matcher.match_many(words)
+
+    def search(self, word: str) -> bool:
+        """
+        Indica si la expresión regular acepta alguna subcadena de la cadena
+        dada, como grep: equivale a matchear Σ*RΣ*, pero sin agregar esos
+        comodines al autómata y terminando en la primera aparición.
+        """
+        if self._searcher is None:
+            self._searcher = self.compile(search=True)
+        return self._searcher.match(word)
+
+    def search_span(self, word: str) -> Optional[tuple[int, int]]:
+        """
+        Devuelve (inicio, fin) de la subcadena aceptada que empieza más a la
+        izquierda y, entre esas, es la más larga; o None si no hay ninguna.
+        Ver engines.SpanMatcher.
+        """
+        return next(self.search_spans(word), None)
+
+    def search_spans(self, word: str) -> Iterator[tuple[int, int]]:
+        """
+        Devuelve, de izquierda a derecha y sin solaparse, los pares (inicio,
+        fin) de las subcadenas aceptadas, con la misma semántica que
+        search_span.
+        """
+        if self._spanner is None:
+            from engines import compile_spans
+            self._spanner = compile_spans(self)
+        return self._spanner.spans(word)
+
+    def position_automaton(self) -> PositionAutomaton:
+        """Calcula el autómata de posiciones (Glushkov) de la expresión regular."""
+        automaton = PositionAutomaton()
+        first, last = self._glushkov(automaton)
+        automaton.follow[0] = first
+        automaton.final = last | (1 if self.nullable() else 0)
+        return automaton
 
     @abstractmethod
     def to_afnd(self) -> AFND:
         """Convierte la expresión regular a un AFND."""
         pass
 
+    def to_afnd_glushkov(self) -> AFND:
+        """
+        Convierte la expresión regular a un AFND sin transiciones λ, con la
+        construcción de Glushkov: un estado por cada aparición de un carácter
+        (qi para la posición i) más el estado inicial q0.
+        """
+        positions = self.position_automaton()
+        automata = AFND()
+        for position in range(positions.size()):
+            automata.add_state(f"q{position}", bool(positions.final >> position & 1))
+        automata.mark_initial_state("q0")
+        for position, follow in enumerate(positions.follow):
+            for next_position in range(1, positions.size()):
+                if follow >> next_position & 1:
+                    automata.add_transition(f"q{position}", f"q{next_position}", positions.chars[next_position])
+        return automata
+
+    def to_afnd_antimirov(self) -> AFND:
+        """
+        Convierte la expresión regular a un AFND sin transiciones λ, con la
+        construcción de Antimirov: los estados son las derivadas parciales de
+        la expresión (q0 es la expresión original). Si la expresión tiene
+        clases de caracteres, se deriva respecto de cada mintérmino de sus
+        etiquetas (ver automata.ranges.minterms) en lugar de cada carácter.
+        """
+        from engines.derivatives import DerivativeBuilder
+
+        builder = DerivativeBuilder()
+        initial = builder.build(self)
+        labels = set(char for char in self.position_automaton().chars if char is not None)
+        alphabet = [symbol for symbol, _ in minterms(labels)]
+
+        automata = AFND()
+        names = {initial: "q0"}
+        automata.add_state("q0", builder.nullable(initial))
+        automata.mark_initial_state("q0")
+        pending = [initial]
+        while pending:
+            exp = pending.pop()
+            for char in alphabet:
+                for derivative in builder.partial_derive(exp, char):
+                    if derivative not in names:
+                        names[derivative] = f"q{len(names)}"
+                        automata.add_state(names[derivative], builder.nullable(derivative))
+                        pending.append(derivative)
+                    automata.add_transition(names[exp], names[derivative], char)
+        return automata
+
+    @abstractmethod
+    def _range_match(self, word: str, start: int, end: int, memo) -> bool:
+        """
+        (Interno) Indica si la expresión regular acepta word[start:end].
+        Los subproblemas se resuelven con memo.solve(nodo, inicio, fin), que
+        memoiza los resultados (ver engines.MemoMatcher).
+        """
+        pass
+
+    @abstractmethod
+    def nullable(self) -> bool:
+        """Indica si la expresión regular acepta la cadena vacía."""
+        pass
+
+    @abstractmethod
+    def _derivative(self, char: str, builder) -> "RegEx":
+        """
+        (Interno) Calcula la derivada de Brzozowski respecto de char. Las
+        subexpresiones se derivan con builder.derive y se combinan con los
+        constructores simplificadores de builder (ver engines.DerivativeBuilder).
+        """
+        pass
+
+    @abstractmethod
+    def _partial_derivatives(self, char: str, builder) -> frozenset["RegEx"]:
+        """
+        (Interno) Calcula las derivadas parciales de Antimirov respecto de char,
+        con los constructores de builder (ver engines.DerivativeBuilder).
+        """
+        pass
+
+    @abstractmethod
+    def _glushkov(self, automaton: PositionAutomaton) -> tuple[int, int]:
+        """
+        (Interno) Agrega las posiciones de la expresión regular al autómata y
+        devuelve sus conjuntos first y last (como vectores de bits).
+        """
+        pass
+
+    def intern(self) -> "RegEx":
+        """
+        Devuelve la instancia canónica de la expresión regular: dos expresiones
+        estructuralmente iguales internadas son el mismo objeto, y cada
+        subexpresión distinta existe una única vez.
+        """
+        args = tuple(arg.intern() if isinstance(arg, RegEx) else arg for arg in self._key())
+        key = (type(self),) + tuple(id(arg) if isinstance(arg, RegEx) else arg for arg in args)
+        exp = _interned.get(key)
+        if exp is None:
+            exp = self if all(arg is own for arg, own in zip(args, self._key())) else type(self)(*args)
+            _interned[key] = exp
+        return exp
+
+    def __eq__(self, other) -> bool:
+        """Igualdad estructural (iterativa, para admitir expresiones profundas)."""
+        pairs_to_compare = [(self, other)]
+        while len(pairs_to_compare) > 0:
+            exp1, exp2 = pairs_to_compare.pop()
+            if exp1 is exp2:
+                continue
+            if type(exp1) is not type(exp2) or hash(exp1) != hash(exp2):
+                return False
+            for arg1, arg2 in zip(exp1._key(), exp2._key()):
+                if isinstance(arg1, RegEx):
+                    pairs_to_compare.append((arg1, arg2))
+                elif arg1 != arg2:
+                    return False
+        return True
+
+    def __hash__(self) -> int:
+        """
+        Hash estructural, guardado en el nodo. Los nodos compuestos lo calculan
+        al construirse (ver _init_hash), a partir del de sus hijos, para no
+        recursionar sobre toda la expresión la primera vez que se use.
+        """
+        if self._hash is None:
+            self._init_hash()
+        return self._hash
+
+    def _init_hash(self):
+        """
+        (Interno) Calcula y guarda el hash estructural del nodo. Como usa el
+        hash ya guardado de cada hijo, cuesta O(1) por nodo si se llama al
+        construirlo.
+        """
+        self._hash = hash((type(self).__name__,) + self._key())
+
+    def literals(self) -> Literals:
+        """
+        Calcula (y guarda en el nodo) los literales obligatorios de la
+        expresión regular: prefijo, sufijo y factor que aparecen en toda cadena
+        aceptada. Devuelve None si la expresión no acepta ninguna cadena.
+        """
+        if self._literals is None:
+            self._bottom_up("_literals", "_literal_info")
+        return self._literals[0]
+
+    def _bottom_up(self, cache: str, info: str):
+        """
+        (Interno) Calcula un atributo guardado en los nodos (ver literals,
+        bounds y unrolled_size) con el método info, para la expresión y sus subexpresiones, en
+        post-orden y de forma iterativa: cuando info consulta el atributo de
+        los hijos, ya está calculado, así que no hay recursión sin importar
+        la profundidad.
+        """
+        exps_to_visit = [(self, False)]
+        while len(exps_to_visit) > 0:
+            exp, ready = exps_to_visit.pop()
+            if getattr(exp, cache) is not None:
+                continue
+            if ready:
+                setattr(exp, cache, (getattr(exp, info)(),))
+                continue
+            exps_to_visit.append((exp, True))
+            exps_to_visit.extend((sub, False) for sub in exp._subexpressions() if getattr(sub, cache) is None)
+
+    def _subexpressions(self) -> list["RegEx"]:
+        """(Interno) Subexpresiones cuyos atributos usa el nodo (ver _bottom_up)."""
+        return [arg for arg in self._key() if isinstance(arg, RegEx)]
+
+    @abstractmethod
+    def _literal_info(self) -> Literals:
+        """(Interno) Calcula los literales obligatorios (ver literals)."""
+        pass
+
+    def bounds(self) -> Bounds:
+        """
+        Calcula (y guarda en el nodo) las cotas de largo y los conjuntos de
+        primeros y últimos caracteres de las cadenas aceptadas. Devuelve None
+        si la expresión no acepta ninguna cadena.
+        """
+        if self._bounds is None:
+            self._bottom_up("_bounds", "_bounds_info")
+        return self._bounds[0]
+
+    @abstractmethod
+    def _bounds_info(self) -> Bounds:
+        """(Interno) Calcula las cotas de las cadenas aceptadas (ver bounds)."""
+        pass
+
+    def unrolled_size(self) -> int:
+        """
+        Calcula (y guarda en el nodo) la cantidad de nodos de la expresión
+        con las repeticiones acotadas desenrolladas, que es el tamaño de los
+        AFND que se construyen a partir de ella (ver Repeat.to_afnd).
+        """
+        if self._unrolled is None:
+            self._bottom_up("_unrolled", "_unrolled_info")
+        return self._unrolled[0]
+
+    def _unrolled_info(self) -> int:
+        """(Interno) Calcula el tamaño desenrollado (ver unrolled_size)."""
+        return 1 + sum(exp._unrolled[0] for exp in self._subexpressions())
+
+    def literal_words(self) -> Optional[list[str]]:
+        """
+        Si la expresión es una unión de literales (concatenaciones de
+        caracteres), devuelve la lista de esas palabras, sin repetidos y en
+        orden de aparición; si no, None. El árbol se recorre de forma
+        iterativa, así que admite uniones con muchas alternativas. El
+        resultado se guarda en el nodo.
+        """
+        if self._words is None:
+            self._words = (self._literal_words(),)
+        return self._words[0]
+
+    def _literal_words(self) -> Optional[list[str]]:
+        """(Interno) Calcula las palabras de una unión de literales (ver literal_words)."""
+        words = {}
+        exps_to_visit = [self]
+        while len(exps_to_visit) > 0:
+            exp = exps_to_visit.pop()
+            if isinstance(exp, Union):
+                exps_to_visit.extend((exp.exp2, exp.exp1))
+            elif isinstance(exp, Empty):
+                continue
+            else:
+                # Recorremos la concatenación en orden, también de forma iterativa
+                chars = []
+                parts_to_visit = [exp]
+                while len(parts_to_visit) > 0:
+                    part = parts_to_visit.pop()
+                    if isinstance(part, Concat):
+                        parts_to_visit.extend((part.exp2, part.exp1))
+                    elif isinstance(part, Char):
+                        chars.append(part.char)
+                    elif not isinstance(part, Lambda):
+                        return None
+                words["".join(chars)] = None
+        return list(words)
+
+    @abstractmethod
+    def simplify(self) -> "RegEx":
+        """
+        Devuelve una expresión regular equivalente, simplificada con reglas
+        algebraicas (∅|r = r, ∅r = ∅, λr = r, (r*)* = r*, (r+)* = r*, r|r = r,
+        ...). Las alternativas de las uniones quedan ordenadas y sin repetidos.
+        No modifica la expresión original.
+        """
+        pass
+
+    @abstractmethod
+    def _key(self) -> tuple:
+        """
+        (Interno) Devuelve los argumentos del constructor del nodo, que
+        determinan su estructura. Útil para implementar __eq__, __hash__ e
+        intern.
+        """
+        pass
+
     @abstractmethod
     def _atomic(self) -> bool:
         """
@@ -43,14 +466,50 @@ class RegEx(ABC):
         pass
 
 
+# Instancias canónicas de intern: (clase, argumentos) -> expresión. Los
+# argumentos que son expresiones se identifican por su id, ya que están
+# internados y se mantienen vivos mientras viva la expresión que los contiene.
+_interned = weakref.WeakValueDictionary()
+
+
 class Empty(RegEx):
     """Expresión regular que denota el lenguaje vacío (∅)."""
 
     def naive_match(self, word: str):
         return False
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return False
+
+    def nullable(self):
+        return False
+
+    def _derivative(self, char: str, builder):
+        return builder.empty
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        return 0, 0
+
+    def _partial_derivatives(self, char: str, builder):
+        return frozenset()
+
     def to_afnd(self) -> AFND:
-        return AFND()
+        automata = AFND()
+        automata.add_state('q0', False)
+        automata.mark_initial_state('q0')
+        return automata
+
+    def _literal_info(self):
+        return None
+
+    def _bounds_info(self):
+        return None
+
+    def simplify(self):
+        return self
+
+    def _key(self):
+        return ()
 
     def _atomic(self):
         return True
@@ -65,12 +524,39 @@ class Lambda(RegEx):
     def naive_match(self, word: str):
         return word == ""
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return start == end
+
+    def nullable(self):
+        return True
+
+    def _derivative(self, char: str, builder):
+        return builder.empty
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        return 0, 0
+
+    def _partial_derivatives(self, char: str, builder):
+        return frozenset()
+
     def to_afnd(self) -> AFND:
         automata = AFND() 
         automata.add_state('q0', True)
         automata.mark_initial_state('q0')
         return automata 
 
+    def _literal_info(self):
+        return Literals.of_word("")
+
+    def _bounds_info(self):
+        return Bounds(0, 0, frozenset(), frozenset())
+
+    def simplify(self):
+        return self
+
+    def _key(self):
+        return ()
+
     def _atomic(self):
         return True
 
@@ -88,6 +574,22 @@ class Char(RegEx):
     def naive_match(self, word: str):
         return word == self.char
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return end - start == 1 and word[start] == self.char
+
+    def nullable(self):
+        return False
+
+    def _derivative(self, char: str, builder):
+        return builder.lambda_ if char == self.char else builder.empty
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        position = automaton.add_position(self.char)
+        return position, position
+
+    def _partial_derivatives(self, char: str, builder):
+        return frozenset([builder.lambda_]) if char == self.char else frozenset()
+
     def to_afnd(self) -> AFND:
         automata = AFND()
         automata.add_state('q0', False) 
@@ -96,6 +598,18 @@ class Char(RegEx):
         automata.mark_initial_state('q0')
         return automata
         
+    def _literal_info(self):
+        return Literals.of_word(self.char)
+
+    def _bounds_info(self):
+        return Bounds(1, 1, frozenset(self.char), frozenset(self.char))
+
+    def simplify(self):
+        return self
+
+    def _key(self):
+        return (self.char,)
+
     def _atomic(self):
         return True
 
@@ -103,12 +617,88 @@ class Char(RegEx):
         return self.char
 
 
+class CharClass(RegEx):
+    """
+    Expresión regular que denota el lenguaje de los caracteres de un
+    conjunto (como [a-z], \\w o una clase Unicode). El conjunto se guarda como
+    intervalos de códigos (ver automata.CharSet), así que en los autómatas la
+    clase es una única transición, sin importar cuántos caracteres tenga.
+    """
+
+    def __init__(self, chars: Union_[CharSet, Iterable[tuple[str, str]]]):
+        self.chars = chars if isinstance(chars, CharSet) else CharSet(chars)
+        self._init_hash()
+
+    def naive_match(self, word: str):
+        return len(word) == 1 and word in self.chars
+
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return end - start == 1 and word[start] in self.chars
+
+    def nullable(self):
+        return False
+
+    def _derivative(self, char: str, builder):
+        return builder.lambda_ if char in self.chars else builder.empty
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        position = automaton.add_position(self._label())
+        return position, position
+
+    def _partial_derivatives(self, char, builder):
+        # char puede ser un mintérmino (ver to_afnd_antimirov), que está
+        # incluido en la clase o es disjunto con ella
+        return frozenset([builder.lambda_]) if char in self.chars else frozenset()
+
+    def to_afnd(self) -> AFND:
+        automata = AFND()
+        automata.add_state('q0', False)
+        automata.add_state('q1', True)
+        if len(self.chars) > 0:
+            automata.add_transition('q0', 'q1', self._label())
+        automata.mark_initial_state('q0')
+        return automata
+
+    def _literal_info(self):
+        if len(self.chars) == 0:
+            return None
+        if len(self.chars) == 1:
+            return Literals.of_word(next(self.chars.chars()))
+        return Literals("", "", "")
+
+    def _bounds_info(self):
+        if len(self.chars) == 0:
+            return None
+        return Bounds(1, 1, self.chars, self.chars)
+
+    def simplify(self):
+        if len(self.chars) == 0:
+            return Empty()
+        if len(self.chars) == 1:
+            return Char(next(self.chars.chars()))
+        return self
+
+    def _label(self):
+        """(Interno) Etiqueta de transición de la clase: su carácter si es uno solo, o el CharSet."""
+        return next(self.chars.chars()) if len(self.chars) == 1 else self.chars
+
+    def _key(self):
+        return (self.chars,)
+
+    def _atomic(self):
+        return True
+
+    def __str__(self):
+        return str(self.chars)
+
+
 class Concat(RegEx):
     """Expresión regular que denota la concatenación de dos expresiones regulares."""
 
     def __init__(self, exp1: RegEx, exp2: RegEx):
         self.exp1 = exp1
         self.exp2 = exp2
+        self._init_hash()
 
     def naive_match(self, word: str):
         for i in range(len(word) + 1):
@@ -116,6 +706,36 @@ class Concat(RegEx):
                 return True
         return False
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        for i in range(start, end + 1):
+            if memo.solve(self.exp1, start, i) and memo.solve(self.exp2, i, end):
+                return True
+        return False
+
+    def nullable(self):
+        return self.exp1.nullable() and self.exp2.nullable()
+
+    def _derivative(self, char: str, builder):
+        derivative = builder.concat(builder.derive(self.exp1, char), self.exp2)
+        if builder.nullable(self.exp1):
+            derivative = builder.union(derivative, builder.derive(self.exp2, char))
+        return derivative
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        first1, last1 = self.exp1._glushkov(automaton)
+        first2, last2 = self.exp2._glushkov(automaton)
+        automaton.link(last1, first2)
+        first = first1 | first2 if self.exp1.nullable() else first1
+        last = last1 | last2 if self.exp2.nullable() else last2
+        return first, last
+
+    def _partial_derivatives(self, char: str, builder):
+        derivatives = frozenset(builder.concat(derivative, self.exp2)
+                                for derivative in builder.partial_derive(self.exp1, char))
+        if builder.nullable(self.exp1):
+            derivatives |= builder.partial_derive(self.exp2, char)
+        return derivatives
+
     def to_afnd(self) -> AFND:
         automata_exp1 = self.exp1.to_afnd() 
         automata_exp2 = self.exp2.to_afnd()
@@ -133,7 +753,7 @@ class Concat(RegEx):
         self._add_transitions(automata_exp2, final_automata,'_2') 
 
         for final_state in automata_exp1.final_states:
-            final_automata.add_transition(final_state+'_1',automata_exp2.initial_state+'_2','λ')
+            final_automata.add_transition(final_state+'_1',automata_exp2.initial_state+'_2',SpecialSymbol.Lambda)
         
         return final_automata.normalize_states() 
     
@@ -143,6 +763,48 @@ class Concat(RegEx):
                 for statesTo in destinationStates: 
                     final_automata.add_transition(stateFrom+identifier,statesTo+identifier,symbol)
 
+    def _literal_info(self):
+        literals1 = self.exp1.literals()
+        literals2 = self.exp2.literals()
+        if literals1 is None or literals2 is None:
+            return None
+        if literals1.exact is not None and literals2.exact is not None:
+            return Literals.of_word(literals1.exact + literals2.exact)
+
+        prefix = literals1.prefix if literals1.exact is None else literals1.exact + literals2.prefix
+        suffix = literals2.suffix if literals2.exact is None else literals1.suffix + literals2.exact
+        factor = max(literals1.factor, literals2.factor, literals1.suffix + literals2.prefix, prefix, suffix,
+                     key=len)
+        return Literals(prefix, suffix, factor)
+
+    def _bounds_info(self):
+        bounds1 = self.exp1.bounds()
+        bounds2 = self.exp2.bounds()
+        if bounds1 is None or bounds2 is None:
+            return None
+        max_length = None
+        if bounds1.max_length is not None and bounds2.max_length is not None:
+            max_length = bounds1.max_length + bounds2.max_length
+        first_chars = bounds1.first_chars | bounds2.first_chars if bounds1.min_length == 0 else bounds1.first_chars
+        last_chars = bounds1.last_chars | bounds2.last_chars if bounds2.min_length == 0 else bounds2.last_chars
+        return Bounds(bounds1.min_length + bounds2.min_length, max_length, first_chars, last_chars)
+
+    def simplify(self):
+        exp1 = self.exp1.simplify()
+        exp2 = self.exp2.simplify()
+        if isinstance(exp1, Empty) or isinstance(exp2, Empty):
+            return Empty()
+        if isinstance(exp1, Lambda):
+            return exp2
+        if isinstance(exp2, Lambda):
+            return exp1
+        if exp1 is self.exp1 and exp2 is self.exp2:
+            return self
+        return Concat(exp1, exp2)
+
+    def _key(self):
+        return (self.exp1, self.exp2)
+
     def _atomic(self):
         return False
 
@@ -157,10 +819,28 @@ class Union(RegEx):
     def __init__(self, exp1: RegEx, exp2: RegEx):
         self.exp1 = exp1
         self.exp2 = exp2
+        self._init_hash()
 
     def naive_match(self, word: str):
         return self.exp1.naive_match(word) or self.exp2.naive_match(word)
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return memo.solve(self.exp1, start, end) or memo.solve(self.exp2, start, end)
+
+    def nullable(self):
+        return self.exp1.nullable() or self.exp2.nullable()
+
+    def _derivative(self, char: str, builder):
+        return builder.union(builder.derive(self.exp1, char), builder.derive(self.exp2, char))
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        first1, last1 = self.exp1._glushkov(automaton)
+        first2, last2 = self.exp2._glushkov(automaton)
+        return first1 | first2, last1 | last2
+
+    def _partial_derivatives(self, char: str, builder):
+        return builder.partial_derive(self.exp1, char) | builder.partial_derive(self.exp2, char)
+
     def to_afnd(self) -> AFND:
         automata_exp1 = self.exp1.to_afnd()
         automata_exp2 = self.exp2.to_afnd()
@@ -176,8 +856,8 @@ class Union(RegEx):
         self._add_transitions(automata_exp2, final_automata,'_2')
         final_automata.add_state('q0',False)
         final_automata.mark_initial_state('q0')
-        final_automata.add_transition('q0',automata_exp1.initial_state+'_1','λ')
-        final_automata.add_transition('q0',automata_exp2.initial_state+'_2','λ')
+        final_automata.add_transition('q0',automata_exp1.initial_state+'_1',SpecialSymbol.Lambda)
+        final_automata.add_transition('q0',automata_exp2.initial_state+'_2',SpecialSymbol.Lambda)
         
         return final_automata.normalize_states()
     
@@ -187,6 +867,93 @@ class Union(RegEx):
                 for statesTo in destinationStates: 
                     final_automata.add_transition(stateFrom+identifier,statesTo+identifier,symbol)
 
+    def _subexpressions(self):
+        # Las uniones anidadas se recorren al calcular el atributo de la unión
+        # más externa, así que solo interesan las alternativas (ver simplify)
+        alternatives = []
+        exps_to_visit = [self]
+        while len(exps_to_visit) > 0:
+            exp = exps_to_visit.pop()
+            if isinstance(exp, Union):
+                exps_to_visit.extend((exp.exp2, exp.exp1))
+            else:
+                alternatives.append(exp)
+        return alternatives
+
+    def _literal_info(self):
+        # Recorremos las uniones anidadas de forma iterativa (ver simplify)
+        literals = None
+        exps_to_visit = [self]
+        while len(exps_to_visit) > 0:
+            exp = exps_to_visit.pop()
+            if isinstance(exp, Union):
+                exps_to_visit.extend((exp.exp2, exp.exp1))
+                continue
+            other = exp.literals()
+            if other is None:
+                continue
+            if literals is None:
+                literals = other
+                continue
+            prefix = _common_prefix(literals.prefix, other.prefix)
+            suffix = _common_suffix(literals.suffix, other.suffix)
+            factor = max(_common_factor(literals.factor, other.factor), prefix, suffix, key=len)
+            exact = literals.exact if literals.exact == other.exact else None
+            literals = Literals(prefix, suffix, factor, exact)
+        return literals
+
+    def _bounds_info(self):
+        # Recorremos las uniones anidadas de forma iterativa (ver simplify)
+        bounds = None
+        exps_to_visit = [self]
+        while len(exps_to_visit) > 0:
+            exp = exps_to_visit.pop()
+            if isinstance(exp, Union):
+                exps_to_visit.extend((exp.exp2, exp.exp1))
+                continue
+            other = exp.bounds()
+            if other is None:
+                continue
+            if bounds is None:
+                bounds = other
+                continue
+            max_length = None
+            if bounds.max_length is not None and other.max_length is not None:
+                max_length = max(bounds.max_length, other.max_length)
+            bounds = Bounds(min(bounds.min_length, other.min_length), max_length,
+                            bounds.first_chars | other.first_chars, bounds.last_chars | other.last_chars)
+        return bounds
+
+    def simplify(self):
+        # Recorremos las uniones anidadas de forma iterativa, para no recursionar
+        # una vez por alternativa en uniones con muchas alternativas
+        alternatives = {}
+        exps_to_visit = [self]
+        while len(exps_to_visit) > 0:
+            exp = exps_to_visit.pop()
+            if isinstance(exp, Union):
+                exps_to_visit.extend((exp.exp2, exp.exp1))
+                continue
+            exp = exp.simplify()
+            if isinstance(exp, Union):
+                exps_to_visit.append(exp)
+            elif not isinstance(exp, Empty):
+                alternatives[exp] = str(exp)
+
+        if len(alternatives) == 0:
+            return Empty()
+        if any(exp.nullable() for exp in alternatives if not isinstance(exp, Lambda)):
+            alternatives.pop(Lambda(), None)
+
+        ordered = sorted(alternatives, key=alternatives.__getitem__)
+        union = ordered.pop()
+        while ordered:
+            union = Union(ordered.pop(), union)
+        return self if union == self else union
+
+    def _key(self):
+        return (self.exp1, self.exp2)
+
     def _atomic(self):
         return False
 
@@ -200,6 +967,7 @@ class Star(RegEx):
 
     def __init__(self, exp: RegEx):
         self.exp = exp
+        self._init_hash()
 
     def naive_match(self, word: str):
         if word == "" or self.exp.naive_match(word):
@@ -209,20 +977,62 @@ class Star(RegEx):
                 return True
         return False
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return _closure_range_match(self, word, start, end, memo, True)
+
+    def nullable(self):
+        return True
+
+    def _derivative(self, char: str, builder):
+        return builder.concat(builder.derive(self.exp, char), self)
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        first, last = self.exp._glushkov(automaton)
+        automaton.link(last, first)
+        return first, last
+
+    def _partial_derivatives(self, char: str, builder):
+        return frozenset(builder.concat(derivative, self) for derivative in builder.partial_derive(self.exp, char))
+
     def to_afnd(self) -> AFND:
         automata_exp = self.exp.to_afnd()
-        
+        old_initial_state = automata_exp.initial_state
     
         automata_exp.add_state("q0'",True)
 
         
-        automata_exp.add_transition("q0'",automata_exp.initial_state,'λ')
+        automata_exp.add_transition("q0'",old_initial_state,SpecialSymbol.Lambda)
         automata_exp.mark_initial_state("q0'")
 
         for final_state in automata_exp.final_states:
-            automata_exp.add_transition(final_state,automata_exp.initial_state+'_1','λ')
+            automata_exp.add_transition(final_state,old_initial_state,SpecialSymbol.Lambda)
         return automata_exp.normalize_states()
 
+    def _literal_info(self):
+        literals = self.exp.literals()
+        if literals is None or literals.exact == "":
+            return Literals.of_word("")
+        return Literals("", "", "")
+
+    def _bounds_info(self):
+        bounds = self.exp.bounds()
+        if bounds is None or bounds.max_length == 0:
+            return Bounds(0, 0, frozenset(), frozenset())
+        return Bounds(0, None, bounds.first_chars, bounds.last_chars)
+
+    def simplify(self):
+        exp = self.exp.simplify()
+        if isinstance(exp, (Empty, Lambda)):
+            return Lambda()
+        if isinstance(exp, Star):
+            return exp
+        if isinstance(exp, Plus):
+            return Star(exp.exp)
+        return self if exp is self.exp else Star(exp)
+
+    def _key(self):
+        return (self.exp,)
+
     def _atomic(self):
         return False
 
@@ -235,6 +1045,7 @@ class Plus(RegEx):
 
     def __init__(self, exp: RegEx):
         self.exp = exp
+        self._init_hash()
 
     def naive_match(self, word: str):
         if self.exp.naive_match(word):
@@ -244,15 +1055,279 @@ class Plus(RegEx):
                 return True
         return False
 
+    def _range_match(self, word: str, start: int, end: int, memo):
+        return _closure_range_match(self, word, start, end, memo, False)
+
+    def nullable(self):
+        return self.exp.nullable()
+
+    def _derivative(self, char: str, builder):
+        return builder.concat(builder.derive(self.exp, char), builder.star(self.exp))
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        first, last = self.exp._glushkov(automaton)
+        automaton.link(last, first)
+        return first, last
+
+    def _partial_derivatives(self, char: str, builder):
+        star = builder.star(self.exp)
+        return frozenset(builder.concat(derivative, star) for derivative in builder.partial_derive(self.exp, char))
+
     def to_afnd(self) -> AFND:
         automata_exp = self.exp.to_afnd()
         
         for final_state in automata_exp.final_states: 
-            automata_exp.add_transition(final_state,automata_exp.initial_state,'λ') 
+            automata_exp.add_transition(final_state,automata_exp.initial_state,SpecialSymbol.Lambda) 
         return automata_exp
 
+    def _literal_info(self):
+        literals = self.exp.literals()
+        if literals is None or literals.exact == "":
+            return literals
+        return Literals(literals.prefix, literals.suffix, literals.factor)
+
+    def _bounds_info(self):
+        bounds = self.exp.bounds()
+        if bounds is None or bounds.max_length == 0:
+            return bounds
+        return Bounds(bounds.min_length, None, bounds.first_chars, bounds.last_chars)
+
+    def simplify(self):
+        exp = self.exp.simplify()
+        if isinstance(exp, (Empty, Lambda, Star, Plus)):
+            return exp
+        return self if exp is self.exp else Plus(exp)
+
+    def _key(self):
+        return (self.exp,)
+
     def _atomic(self) -> bool:
         return False
 
     def __str__(self):
         return f"({self.exp})+" if not self.exp._atomic() else f"{self.exp}+"
+
+
+class Repeat(RegEx):
+    """
+    Expresión regular que denota la repetición acotada de otra expresión
+    regular: entre min y max veces. max es obligatorio: Repeat(r, n, n) es
+    r{n}, y Repeat(r, n, None) es r{n,}, sin cota superior. Las cotas se
+    guardan como enteros, sin copiar la subexpresión.
+    """
+
+    def __init__(self, exp: RegEx, min: int, max: Optional[int]):
+        if min < 0 or (max is not None and max < min):
+            raise ValueError(f"Las cotas {{{min},{max}}} de la repetición no son válidas.")
+        self.exp = exp
+        self.min = min
+        self.max = max
+        self._init_hash()
+
+    def naive_match(self, word: str):
+        if self.max == 0:
+            return word == ""
+        if word == "":
+            return self.min == 0 or self.exp.naive_match("")
+        # Una iteración que no consume caracteres no aporta: la primera consume word[:i]
+        rest = self._decrement()
+        for i in range(1, len(word) + 1):
+            if self.exp.naive_match(word[:i]) and rest.naive_match(word[i:]):
+                return True
+        return False
+
+    def _range_match(self, word: str, start: int, end: int, memo):
+        minimum = 0 if self.exp.nullable() else self.min
+        if start == end:
+            return minimum == 0
+        # positions son los inicios alcanzables con count iteraciones no vacías
+        positions = {start}
+        count = 0
+        while positions and (self.max is None or count < self.max):
+            count += 1
+            positions = {j for i in positions for j in range(i + 1, end + 1) if memo.solve(self.exp, i, j)}
+            if count >= minimum and end in positions:
+                return True
+        return False
+
+    def nullable(self):
+        return self.min == 0 or self.exp.nullable()
+
+    def _derivative(self, char: str, builder):
+        if self.max == 0:
+            return builder.empty
+        rest = builder.repeat(self.exp, *self._decremented_bounds())
+        return builder.concat(builder.derive(self.exp, char), rest)
+
+    def _glushkov(self, automaton: PositionAutomaton):
+        # r{m,n} = r^m (r|λ)^(n-m) y r{m,} = r^m r*: una copia de las posiciones por iteración
+        copies = self.min + 1 if self.max is None else self.max
+        exp_nullable = self.exp.nullable()
+        first = last = 0
+        nullable = True
+        for copy in range(copies):
+            copy_first, copy_last = self.exp._glushkov(automaton)
+            if self.max is None and copy == copies - 1:
+                automaton.link(copy_last, copy_first)
+            optional = exp_nullable or copy >= self.min
+            automaton.link(last, copy_first)
+            first |= copy_first if nullable else 0
+            last = copy_last | (last if optional else 0)
+            nullable = nullable and optional
+        return first, last
+
+    def _partial_derivatives(self, char: str, builder):
+        if self.max == 0:
+            return frozenset()
+        rest = builder.repeat(self.exp, *self._decremented_bounds())
+        return frozenset(builder.concat(derivative, rest) for derivative in builder.partial_derive(self.exp, char))
+
+    def to_afnd(self) -> AFND:
+        # r{m,n} = r^m (r|λ)^(n-m) y r{m,} = r^m r*. Cada copia opcional salta
+        # por λ directamente a un único estado de salida compartido, así que el
+        # AFND crece linealmente con las cotas y no se forman cadenas de λ. El
+        # salto sale de un estado de entrada nuevo de la copia, sin transiciones
+        # entrantes desde ella: el estado inicial del AFND de r puede tenerlas
+        # (por ejemplo, el de a+), y saltar desde él cortaría una iteración a la mitad.
+        automata_exp = self.exp.to_afnd()
+        copies = self.min + 1 if self.max is None else self.max
+        states = [automata_exp.initial_state] + sorted(automata_exp.states - {automata_exp.initial_state}, key=str)
+        size = len(states) + 1
+        automata = AFND()
+        exit_state = f"q{copies * size}"
+        if copies == 0:
+            automata.add_state(exit_state, True)
+            automata.mark_initial_state(exit_state)
+            return automata
+
+        entries = [f"q{copy * size}" for copy in range(copies)]
+        names = [{state: f"q{copy * size + 1 + i}" for i, state in enumerate(states)} for copy in range(copies)]
+        for copy in range(copies):
+            automata.add_state(entries[copy])
+            for state in states:
+                automata.add_state(names[copy][state])
+        automata.add_state(exit_state, True)
+        automata.mark_initial_state(entries[0])
+
+        for copy in range(copies):
+            entry = entries[copy]
+            next_entry = entries[copy + 1] if copy + 1 < copies else exit_state
+            automata.add_transition(entry, names[copy][automata_exp.initial_state], SpecialSymbol.Lambda)
+            for state, transitions in automata_exp.transitions.items():
+                for symbol, destinations in transitions.items():
+                    for destination in destinations:
+                        automata.add_transition(names[copy][state], names[copy][destination], symbol)
+            for final_state in automata_exp.final_states:
+                automata.add_transition(names[copy][final_state], next_entry, SpecialSymbol.Lambda)
+                if self.max is None and copy == copies - 1:
+                    automata.add_transition(names[copy][final_state], entry, SpecialSymbol.Lambda)
+            if copy >= self.min:
+                automata.add_transition(entry, exit_state, SpecialSymbol.Lambda)
+        return automata
+
+    def _literal_info(self):
+        literals = self.exp.literals()
+        if literals is None or self.max == 0:
+            return Literals.of_word("") if self.min == 0 else None
+        if literals.exact is not None and (self.min == self.max or literals.exact == ""):
+            return Literals.of_word(literals.exact * self.min)
+        if self.min == 0:
+            return Literals("", "", "")
+        return Literals(literals.prefix, literals.suffix, literals.factor)
+
+    def _bounds_info(self):
+        bounds = self.exp.bounds()
+        if bounds is None or self.max == 0:
+            return Bounds(0, 0, frozenset(), frozenset()) if self.min == 0 else None
+        if bounds.max_length == 0:
+            return bounds
+        max_length = None
+        if bounds.max_length is not None and self.max is not None:
+            max_length = bounds.max_length * self.max
+        return Bounds(bounds.min_length * self.min, max_length, bounds.first_chars, bounds.last_chars)
+
+    def _unrolled_info(self):
+        # Una copia por iteración obligatoria u opcional, más una clausura si no hay cota superior
+        copies = self.max if self.max is not None else self.min + 1
+        return 1 + self.exp._unrolled[0] * max(copies, 1)
+
+    def simplify(self):
+        exp = self.exp.simplify()
+        if self.max == 0 or isinstance(exp, Lambda):
+            return Lambda()
+        if isinstance(exp, Empty):
+            return Lambda() if self.min == 0 else Empty()
+        if self.max is None and self.min <= 1:
+            return Star(exp).simplify() if self.min == 0 else Plus(exp).simplify()
+        if self.min == self.max == 1:
+            return exp
+        return self if exp is self.exp else Repeat(exp, self.min, self.max)
+
+    def _decrement(self) -> "Repeat":
+        """(Interno) Devuelve la repetición con una iteración menos."""
+        return Repeat(self.exp, *self._decremented_bounds())
+
+    def _decremented_bounds(self) -> tuple[int, int]:
+        """(Interno) Cotas de la repetición después de una iteración."""
+        return (self.min - 1 if self.min > 0 else 0), (None if self.max is None else self.max - 1)
+
+    def _key(self):
+        return (self.exp, self.min, self.max)
+
+    def _atomic(self) -> bool:
+        return False
+
+    def __str__(self):
+        if self.max == self.min:
+            bounds = f"{{{self.min}}}"
+        else:
+            bounds = f"{{{self.min},{'' if self.max is None else self.max}}}"
+        return f"({self.exp}){bounds}" if not self.exp._atomic() else f"{self.exp}{bounds}"
+
+
+def _closure_range_match(closure, word: str, start: int, end: int, memo, accepts_empty: bool) -> bool:
+    """
+    (Interno) Resuelve closure (Star o Plus) sobre word[start:end] de forma
+    iterativa, de derecha a izquierda, para no recursionar una vez por cada
+    carácter de la cadena. Los resultados intermedios (closure, i, end) quedan
+    memoizados en memo.
+    """
+    # reaches[i] indica si closure acepta word[i:end]
+    reaches = {end: accepts_empty or memo.solve(closure.exp, end, end)}
+    for i in range(end - 1, start - 1, -1):
+        reaches[i] = memo.solve(closure.exp, i, end)
+        for j in range(i + 1, end):
+            if reaches[j] and memo.solve(closure.exp, i, j):
+                reaches[i] = True
+                break
+        if i > start:
+            memo.store(closure, i, end, reaches[i])
+    return reaches[start]
+
+
+def _common_prefix(word1: str, word2: str) -> str:
+    """(Interno) Devuelve el prefijo común más largo de dos cadenas."""
+    length = 0
+    while length < min(len(word1), len(word2)) and word1[length] == word2[length]:
+        length += 1
+    return word1[:length]
+
+
+def _common_suffix(word1: str, word2: str) -> str:
+    """(Interno) Devuelve el sufijo común más largo de dos cadenas."""
+    return _common_prefix(word1[::-1], word2[::-1])[::-1]
+
+
+def _common_factor(word1: str, word2: str) -> str:
+    """(Interno) Devuelve la subcadena común más larga de dos cadenas."""
+    best_end, best_length = 0, 0
+    previous = [0] * (len(word2) + 1)
+    for i in range(1, len(word1) + 1):
+        current = [0] * (len(word2) + 1)
+        for j in range(1, len(word2) + 1):
+            if word1[i - 1] == word2[j - 1]:
+                current[j] = previous[j - 1] + 1
+                if current[j] > best_length:
+                    best_end, best_length = i, current[j]
+        previous = current
+    return word1[best_end - best_length:best_end]
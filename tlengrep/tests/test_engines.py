@@ -0,0 +1,580 @@
+from os.path import dirname, basename, join
+import glob
+import importlib
+import importlib.util
+import itertools
+import pytest
+import re
+
+from engines import (ENGINES, MAX_UNROLLED_SIZE, AhoCorasick, BitParallelMatcher, ByteDFA, CodegenDFA,
+                     DerivativeMatcher, LazyDFA, LiteralMatcher, MemoMatcher, MultiMatcher, PikeVM, Prefilter,
+                     SpanMatcher, TableDFA, VectorizedDFA, compile_bytes, compile_patterns, compile_spans, utf8_afnd,
+                     utf8_sequences, write_module)
+from automata import CharSet
+from automata.afnd import SpecialSymbol
+from regex import Char, CharClass, Concat, Empty, Lambda, Plus, Repeat, Star, Union
+
+# Setup: Genera los casos de test a partir de los archivos en tests/regexes/*.py
+case_names = [
+    basename(filename)[:-3]
+    for filename in
+    glob.glob(join(dirname(__file__), "regexes/*.py"))
+]
+case_names.sort()
+cases = []
+for case_name in case_names:
+    regex_module = importlib.import_module(f"tests.regexes.{case_name}")
+    cases.append({
+        "name": case_name,
+        "regex": regex_module.__regex__,
+        "should_match": regex_module.__should_match__,
+    })
+
+
+def assert_matches(case, strings, matcher):
+    """Verifica que el matcher acepte exactamente las cadenas correctas."""
+    for string in strings:
+        does_match = matcher.match(string)
+        if type(case["should_match"]) is str:
+            should_match = re.fullmatch(case["should_match"], string) is not None
+        else:
+            should_match = case["should_match"](string)
+        assert does_match == should_match, f"La regex '{case['regex']}' {'no acepta' if should_match else 'acepta'} la cadena '{string}'"
+
+
+def assert_searches(case, strings, matcher):
+    """Verifica que el matcher encuentre el patrón exactamente en las cadenas correctas."""
+    for string in strings:
+        does_match = matcher.match(string)
+        if type(case["should_match"]) is str:
+            should_match = re.search(case["should_match"], string) is not None
+        else:
+            should_match = any(case["should_match"](string[start:end])
+                               for end in range(len(string) + 1) for start in range(end + 1))
+        assert does_match == should_match, f"La regex '{case['regex']}' {'no aparece' if should_match else 'aparece'} en la cadena '{string}'"
+
+
+def expected_spans(case, string):
+    """Calcula por fuerza bruta las apariciones leftmost-longest del patrón en la cadena."""
+    if type(case["should_match"]) is str:
+        accepts = lambda word: re.fullmatch(case["should_match"], word) is not None
+    else:
+        accepts = case["should_match"]
+    spans = []
+    position = 0
+    while position <= len(string):
+        ends = [(start, end) for start in range(position, len(string) + 1)
+                for end in range(len(string), start - 1, -1) if accepts(string[start:end])]
+        if not ends:
+            break
+        start, end = ends[0]
+        spans.append((start, end))
+        position = end if end > start else end + 1
+    return spans
+
+
+# Repeticiones acotadas: (expresión, patrón equivalente de re)
+repeat_cases = [
+    (Repeat(Char('a'), 2, 4), "a{2,4}"),
+    (Repeat(Union(Char('a'), Char('b')), 0, 3), "[ab]{0,3}"),
+    (Concat(Repeat(Char('a'), 3, None), Char('b')), "a{3,}b"),
+    (Repeat(Star(Char('a')), 2, 3), "(a*){2,3}"),
+    (Repeat(Repeat(Union(Char('a'), Char('b')), 2, 2), 1, 3), "([ab]{2}){1,3}"),
+    (Repeat(Union(Char('a'), Lambda()), 2, 3), "(a|){2,3}"),
+    (Concat(Repeat(Concat(Plus(Char('a')), Char('b')), 0, 1), Char('b')), "(a+b){0,1}b"),
+    (Concat(Repeat(Concat(Plus(Char('a')), Char('b')), 1, None), Char('a')), "(a+b){1,}a"),
+]
+repeat_strings = ["".join(chars) for length in range(8) for chars in itertools.product("ab", repeat=length)]
+
+# Clases de caracteres: (expresión, patrón equivalente de re)
+char_class_cases = [
+    (Plus(CharClass([('a', 'z')])), "[a-z]+"),
+    (Concat(Char('b'), Star(CharClass([('a', 'c')]))), "b[a-c]*"),
+    (Union(CharClass([('a', 'm')]), CharClass([('h', 'z')])), "[a-m]|[h-z]"),
+    (Concat(Star(CharClass(CharSet.of("a").complement())), Char('a')), "[^a]*a"),
+    (Concat(Plus(CharClass([('α', 'ω'), ('Ѐ', 'ӿ')])), Union(Char('x'), CharClass([('a', 'z')]))),
+     "[α-ωЀ-ӿ]+(x|[a-z])"),
+    (Repeat(CharClass([('0', '9')]), 2, 3), "[0-9]{2,3}"),
+]
+char_class_strings = ["".join(chars) for length in range(4) for chars in itertools.product("ahx9ωЖ!", repeat=length)]
+
+
+def count_chars(regex):
+    """Cuenta las apariciones de caracteres en la expresión regular."""
+    if isinstance(regex, Char):
+        return 1
+    return sum(count_chars(getattr(regex, exp)) for exp in ("exp", "exp1", "exp2") if hasattr(regex, exp))
+
+
+# Casos de test
+class TestEngines:
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_memo_match(self, case, strings):
+        '''El matcher memoizado acepta las cadenas correctas'''
+        assert_matches(case, strings, MemoMatcher(case["regex"]))
+
+    def test_memo_match_nested_star(self):
+        '''El matcher memoizado resuelve (a*)*b en tiempo polinomial'''
+        regex = Concat(Star(Star(Char('a'))), Char('b'))
+        matcher = MemoMatcher(regex)
+        assert not matcher.match("a" * 40)
+        assert matcher.match("a" * 40 + "b")
+        assert matcher.cache_hits > 0
+        assert matcher.subproblems > 0
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_simplify_match(self, case, strings):
+        '''La expresión simplificada acepta las cadenas correctas'''
+        assert_matches(case, strings, PikeVM(case["regex"].simplify().to_afnd()))
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_pikevm_match(self, case, strings):
+        '''La simulación del AFND acepta las cadenas correctas'''
+        assert_matches(case, strings, PikeVM(case["regex"].to_afnd()))
+
+    def test_pikevm_adversarial(self):
+        '''La simulación del AFND es lineal en patrones que explotan al determinizar'''
+        # (a|b)*a(a|b)(a|b)...(a|b): el AFD mínimo tiene 2^n estados
+        regex = Concat(Star(Union(Char('a'), Char('b'))), Char('a'))
+        for _ in range(12):
+            regex = Concat(regex, Union(Char('a'), Char('b')))
+        matcher = PikeVM(regex.to_afnd())
+        assert matcher.match("ab" * 500 + "a" + "b" * 12)
+        assert not matcher.match("ab" * 500 + "b" * 13)
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_lazydfa_match(self, case, strings):
+        '''El AFD perezoso acepta las cadenas correctas'''
+        assert_matches(case, strings, LazyDFA(case["regex"].to_afnd()))
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_lazydfa_flush(self, case, strings):
+        '''El AFD perezoso sigue siendo correcto con un caché mínimo'''
+        matcher = LazyDFA(case["regex"].to_afnd(), max_states=3)
+        assert_matches(case, strings, matcher)
+        assert matcher.stats()["states"] <= 3
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_derivatives_match(self, case, strings):
+        '''El matcher de derivadas acepta las cadenas correctas'''
+        assert_matches(case, strings, DerivativeMatcher(case["regex"]))
+
+    def test_derivatives_finite(self):
+        '''Las derivadas de (a|b)*a(a|b) son finitas y se reutilizan entre cadenas'''
+        regex = Concat(Star(Union(Char('a'), Char('b'))), Concat(Char('a'), Union(Char('a'), Char('b'))))
+        matcher = DerivativeMatcher(regex)
+        assert matcher.match("ab" * 10 + "aa")
+        assert not matcher.match("ba" * 10 + "ab" + "b")
+        derivatives = matcher.stats()["derivatives"]
+        assert matcher.match("ab" * 1000 + "ab")
+        assert not matcher.match("ba" * 1000 + "bb")
+        assert matcher.stats()["derivatives"] == derivatives
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_bitparallel_match(self, case, strings):
+        '''La simulación bit-paralela acepta las cadenas correctas'''
+        assert_matches(case, strings, BitParallelMatcher(case["regex"]))
+
+    def test_bitparallel_large_pattern(self):
+        '''La simulación bit-paralela admite patrones de más de 64 posiciones'''
+        regex = Char('a')
+        for char in "bcdefghij" * 20:
+            regex = Concat(regex, Union(Char(char), Char('z')))
+        matcher = BitParallelMatcher(regex, max_cache=8)
+        assert matcher.stats()["positions"] == 362
+        assert matcher.match("a" + "bcdefghij" * 19 + "zzzzzzzzz")
+        assert not matcher.match("a" + "bcdefghij" * 19 + "zzzzzzzza")
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_glushkov_match(self, case, strings):
+        '''El AFND de Glushkov acepta las cadenas correctas'''
+        assert_matches(case, strings, PikeVM(case["regex"].to_afnd_glushkov()))
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_glushkov_size(self, case):
+        '''El AFND de Glushkov no tiene transiciones λ y tiene un estado por carácter más el inicial'''
+        afnd = case["regex"].to_afnd_glushkov()
+        assert afnd.size() == count_chars(case["regex"]) + 1
+        for transitions in afnd.transitions.values():
+            assert SpecialSymbol.Lambda not in transitions
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_antimirov_match(self, case, strings):
+        '''El AFND de Antimirov acepta las cadenas correctas'''
+        assert_matches(case, strings, PikeVM(case["regex"].to_afnd_antimirov()))
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_antimirov_size(self, case):
+        '''El AFND de Antimirov no tiene transiciones λ ni más estados que el de Glushkov'''
+        afnd = case["regex"].to_afnd_antimirov()
+        assert afnd.size() <= case["regex"].to_afnd_glushkov().size()
+        for transitions in afnd.transitions.values():
+            assert SpecialSymbol.Lambda not in transitions
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_table_match(self, case, strings):
+        '''El AFD compilado a tabla acepta las cadenas correctas'''
+        assert_matches(case, strings, TableDFA(case["regex"].to_afnd().determinize()))
+
+    def test_table_classes(self):
+        '''Los caracteres con las mismas transiciones comparten una columna de la tabla'''
+        regex = Star(Union(Char('a'), Union(Char('b'), Char('c'))))
+        matcher = TableDFA(regex.to_afnd().determinize().minimize())
+        assert matcher.stats()["columns"] == 2
+        assert matcher.match("abcabc")
+        assert not matcher.match("abcñabc")
+
+    def test_table_dead_states(self):
+        '''El AFD compilado a tabla deja de leer la cadena al llegar a un estado muerto'''
+        regex = Concat(Char('a'), Star(Char('b')))
+        matcher = TableDFA(regex.to_afnd().determinize())
+        assert matcher.stats()["dead_states"] == 1
+        assert not matcher.match("c" + "b" * 1000)
+        assert matcher.early_exits == 1
+        assert matcher.match("a" + "b" * 1000)
+        assert matcher.early_exits == 1
+
+    def test_table_many_classes(self):
+        '''La tabla admite más de 256 clases de caracteres'''
+        chars = [chr(code) for code in range(0x400, 0x400 + 300)]
+        regex = Char(chars[0])
+        for char in chars[1:]:
+            regex = Concat(regex, Char(char))
+        matcher = TableDFA(regex.to_afnd_glushkov().determinize())
+        assert matcher.stats()["columns"] > 256
+        assert matcher.match("".join(chars))
+        assert not matcher.match("".join(chars[:-1]) + "a")
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_codegen_match(self, case, strings):
+        '''El matcher generado a partir del AFD mínimo acepta las cadenas correctas'''
+        assert_matches(case, strings, CodegenDFA(case["regex"].to_afnd().determinize().minimize()))
+
+    def test_codegen_module(self, tmp_path):
+        '''El matcher generado se puede escribir como un módulo importable'''
+        regex = Concat(Star(Union(Char('a'), Char('b'))), Char('c'))
+        path = tmp_path / "generated.py"
+        write_module(regex.to_afnd().determinize().minimize(), str(path), name="match_abc")
+        spec = importlib.util.spec_from_file_location("generated", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module.match_abc("abbac")
+        assert not module.match_abc("abba")
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_vectorized_match(self, case, strings):
+        '''La simulación vectorizada del AFD acepta las cadenas correctas'''
+        pytest.importorskip("numpy")
+        matcher = VectorizedDFA(case["regex"].to_afnd().determinize())
+        assert_matches(case, strings, matcher)
+        assert list(matcher.match_many(strings)) == [matcher.match(string) for string in strings]
+
+    def test_vectorized_batch(self):
+        '''La simulación vectorizada admite lotes vacíos, cadenas vacías y caracteres fuera del alfabeto'''
+        pytest.importorskip("numpy")
+        regex = Concat(Star(Union(Char('a'), Char('b'))), Char('c'))
+        matcher = VectorizedDFA(regex.to_afnd().determinize())
+        assert matcher.match_many([]) == bytearray()
+        assert list(matcher.match_many(["", "c", "abc", "abcc", "axc", "ababababc", "ñc"])) == [0, 1, 1, 0, 0, 1, 0]
+        assert list(matcher.match_many(iter(["abc", "abcc"]))) == [1, 0]
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_compile_match(self, case, engine, strings):
+        '''La expresión compilada (simplificada y con prefiltro) acepta las cadenas correctas'''
+        assert_matches(case, strings, case["regex"].compile(engine))
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_match_many(self, case, engine, strings):
+        '''El matching por lotes coincide con el matching de a una cadena'''
+        matcher = case["regex"].compile(engine)
+        assert list(matcher.match_many(strings)) == [matcher.match(string) for string in strings]
+        assert matcher.match_many([]) == bytearray()
+        # Cualquier iterable de cadenas, también sin el prefiltro
+        expected = list(matcher.match_many(strings))
+        assert list(matcher.match_many(string for string in strings)) == expected
+        assert list(getattr(matcher, "matcher", matcher).match_many(iter(strings))) == expected
+        assert list(case["regex"].match_many(string for string in strings)) == expected
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_search(self, case, engine, strings):
+        '''En modo búsqueda, la expresión compilada encuentra el patrón en cualquier parte de la cadena'''
+        matcher = case["regex"].compile(engine, search=True)
+        assert_searches(case, strings, matcher)
+        assert list(matcher.match_many(strings)) == [matcher.match(string) for string in strings]
+
+    def test_search_early_exit(self):
+        '''En modo búsqueda, el AFD compilado a tabla termina en la primera aparición del patrón'''
+        # ab*c
+        regex = Concat(Char('a'), Concat(Star(Char('b')), Char('c')))
+        matcher = TableDFA(regex.to_afnd().determinize(search=True), search=True)
+        assert matcher.match("xxabbc" + "x" * 1000)
+        assert matcher.match("zzac")
+        assert not matcher.match("abbbx" * 100)
+        assert matcher.stats()["early_exits"] == 2
+        assert regex.search("--abc--")
+        assert not regex.search("--ab--")
+
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_spans(self, case, strings):
+        '''Las apariciones encontradas con los AFD directo y reverso son las leftmost-longest'''
+        matcher = SpanMatcher(case["regex"].to_afnd())
+        for string in strings:
+            spans = expected_spans(case, string)
+            assert list(matcher.spans(string)) == spans
+            assert case["regex"].search_span(string) == (spans[0] if spans else None)
+
+    def test_reverse(self):
+        '''El AFND reverso acepta las cadenas invertidas'''
+        # ab*c
+        regex = Concat(Char('a'), Concat(Star(Char('b')), Char('c')))
+        matcher = PikeVM(regex.to_afnd().reverse())
+        assert matcher.match("cbba")
+        assert matcher.match("ca")
+        assert not matcher.match("abbc")
+
+    @pytest.mark.parametrize("search", [False, True])
+    def test_multi_match(self, search, strings):
+        '''El matcher de varios patrones informa exactamente los patrones que matchean cada cadena'''
+        regexes = [case["regex"] for case in cases]
+        matcher = compile_patterns(regexes, search=search)
+        singles = [regex.compile(search=search) for regex in regexes]
+        for string in strings:
+            expected = [i for i, single in enumerate(singles) if single.match(string)]
+            assert matcher.matches(string) == expected
+            assert matcher.match(string) == bool(expected)
+
+    def test_multi_flush(self):
+        '''El matcher de varios patrones sigue siendo correcto al vaciar el caché'''
+        # ab*, b*c, (a|c)*
+        regexes = [Concat(Char('a'), Star(Char('b'))), Concat(Star(Char('b')), Char('c')),
+                   Star(Union(Char('a'), Char('c')))]
+        matcher = MultiMatcher([regex.to_afnd() for regex in regexes], max_states=3)
+        assert matcher.matches("abbb") == [0]
+        assert matcher.matches("bbc") == [1]
+        assert matcher.matches("a") == [0, 2]
+        assert matcher.matches("") == [2]
+        assert matcher.matches("abc") == []
+        assert matcher.stats()["flushes"] > 0
+
+    def test_literal(self):
+        '''Las expresiones que son una única palabra se compilan sin autómatas'''
+        # abc
+        regex = Concat(Char('a'), Concat(Char('b'), Char('c')))
+        matcher = regex.compile("table")
+        assert isinstance(matcher, LiteralMatcher)
+        assert matcher.match("abc")
+        assert not matcher.match("xabc")
+        searcher = regex.compile("table", search=True)
+        assert searcher.match("xabcx")
+        assert list(searcher.match_many(["abc", "ab", "zzabc"])) == [1, 0, 1]
+        assert list(searcher.spans("abcabxabc")) == [(0, 3), (6, 9)]
+        assert list(LiteralMatcher("").spans("ab")) == [(0, 0), (1, 1), (2, 2)]
+
+    def test_ahocorasick(self):
+        '''El autómata de Aho-Corasick encuentra todas las apariciones de las palabras'''
+        words = ["he", "she", "his", "hers"]
+        assert AhoCorasick(words).match("hers")
+        assert not AhoCorasick(words).match("ushers")
+        assert AhoCorasick(words, search=True).match("ushers")
+        assert not AhoCorasick(words, search=True).match("hi thar")
+        assert AhoCorasick(words).occurrences("ushers") == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+        assert list(AhoCorasick(words).spans("hishers ushe")) == [(0, 3), (3, 7), (9, 12)]
+        assert AhoCorasick([w.encode() for w in words], search=True).match("ushers".encode())
+
+    def test_ahocorasick_many_words(self):
+        '''Las uniones con muchas palabras se compilan a Aho-Corasick sin construir un AFND'''
+        words = [f"host{i}.example" for i in range(20000)]
+        regex = Empty()
+        for word in words:
+            literal = Char(word[-1])
+            for char in reversed(word[:-1]):
+                literal = Concat(Char(char), literal)
+            regex = Union(literal, regex)
+        matcher = regex.compile()
+        assert isinstance(matcher, AhoCorasick)
+        assert matcher.match("host12345.example")
+        assert not matcher.match("host20000.example")
+        searcher = regex.compile(search=True)
+        assert searcher.match("GET http://host19999.example/index.html")
+        assert not searcher.match("GET http://host.example/index.html")
+        spanner = compile_spans(regex)
+        assert isinstance(spanner, AhoCorasick)
+        assert list(spanner.spans("host1.example host12.example")) == [(0, 13), (14, 28)]
+        byte_searcher = compile_bytes(regex, search=True)
+        assert isinstance(byte_searcher, AhoCorasick)
+        assert byte_searcher.match(b"GET http://host19999.example/\xff")
+        assert not byte_searcher.match(b"GET http://host.example/\xff")
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    @pytest.mark.parametrize("regex, pattern", repeat_cases, ids=lambda case: str(case))
+    def test_repeat_match(self, regex, pattern, engine):
+        '''Las repeticiones acotadas se matchean correctamente con todos los motores'''
+        matcher = regex.compile(engine)
+        searcher = regex.compile(engine, search=True)
+        for string in repeat_strings:
+            assert matcher.match(string) == (re.fullmatch(pattern, string) is not None)
+            assert searcher.match(string) == (re.search(pattern, string) is not None)
+
+    @pytest.mark.parametrize("regex, pattern", repeat_cases, ids=lambda case: str(case))
+    def test_repeat_constructions(self, regex, pattern):
+        '''Las tres construcciones de AFND admiten repeticiones acotadas'''
+        for afnd in (regex.to_afnd(), regex.to_afnd_glushkov(), regex.to_afnd_antimirov()):
+            matcher = PikeVM(afnd)
+            for string in repeat_strings:
+                assert matcher.match(string) == (re.fullmatch(pattern, string) is not None)
+
+    def test_repeat_optional_copy(self):
+        '''Una copia opcional no se saltea a mitad de una iteración aunque el cuerpo empiece con una clausura'''
+        # (a+b){0,1}c
+        regex = Concat(Repeat(Concat(Plus(Char('a')), Char('b')), 0, 1), Char('c'))
+        for engine in ENGINES:
+            matcher = regex.compile(engine)
+            assert not matcher.match("ac")
+            assert matcher.match("aabc") and matcher.match("c")
+
+    def test_repeat_compact(self):
+        '''Las derivadas de una repetición anidada guardan las cotas como enteros, sin desenrollarlas'''
+        # ((a|b){100}){1,100}
+        regex = Repeat(Repeat(Union(Char('a'), Char('b')), 100, 100), 1, 100)
+        matcher = DerivativeMatcher(regex)
+        assert matcher.match("ab" * 150)
+        assert not matcher.match("ab" * 150 + "a")
+        assert all(len(str(exp)) <= 2 * len(str(regex)) for exp in matcher.builder.interned)
+
+    def test_repeat_large_bounds(self):
+        '''Las repeticiones con cotas grandes no se desenrollan en un autómata con el motor por defecto'''
+        digit = Char('0')
+        for char in "123456789":
+            digit = Union(digit, Char(char))
+        regex = Repeat(digit, 1, 2000)
+        assert regex.unrolled_size() > MAX_UNROLLED_SIZE
+        matcher = regex.compile()
+        assert isinstance(matcher.matcher, DerivativeMatcher)
+        assert matcher.match("0123456789" * 200)
+        assert not matcher.match("0123456789" * 200 + "0")
+        small = Repeat(digit, 2, 3)
+        assert isinstance(small.compile().matcher, PikeVM)
+
+    @pytest.mark.parametrize("engine", list(ENGINES))
+    @pytest.mark.parametrize("regex, pattern", char_class_cases, ids=lambda case: str(case))
+    def test_char_class_match(self, regex, pattern, engine):
+        '''Las clases de caracteres se matchean correctamente con todos los motores'''
+        matcher = regex.compile(engine)
+        searcher = regex.compile(engine, search=True)
+        for string in char_class_strings:
+            assert matcher.match(string) == (re.fullmatch(pattern, string) is not None)
+            assert searcher.match(string) == (re.search(pattern, string) is not None)
+
+    @pytest.mark.parametrize("regex, pattern", char_class_cases, ids=lambda case: str(case))
+    def test_char_class_constructions(self, regex, pattern):
+        '''Las tres construcciones de AFND etiquetan las transiciones con CharSet'''
+        for afnd in (regex.to_afnd(), regex.to_afnd_glushkov(), regex.to_afnd_antimirov()):
+            matcher = PikeVM(afnd)
+            for string in char_class_strings:
+                assert matcher.match(string) == (re.fullmatch(pattern, string) is not None)
+
+    def test_char_class_unicode(self):
+        '''Una clase sobre todo Unicode es una única transición, también en el AFD mínimo'''
+        # [^a]+a
+        regex = Concat(Plus(CharClass(CharSet.of("a").complement())), Char('a'))
+        afd = regex.to_afnd().determinize().minimize()
+        assert afd.size() == 4
+        assert len(afd.alphabet) == 2
+        matcher = TableDFA(afd)
+        assert matcher.stats()["columns"] == 3
+        assert matcher.match("Ж一\U0001f600a")
+        assert not matcher.match("Ж一\U0001f600")
+        assert "<= char <=" in CodegenDFA(afd).source
+
+    def test_char_class_spans(self):
+        '''Las apariciones de un patrón con clases de caracteres se encuentran con los mintérminos'''
+        regex = Plus(CharClass([('a', 'z'), ('α', 'ω')]))
+        assert list(SpanMatcher(regex.to_afnd()).spans("ab, βγ! z")) == [(0, 2), (4, 6), (8, 9)]
+
+    @pytest.mark.parametrize("search", [False, True])
+    @pytest.mark.parametrize("case", cases, ids=lambda case: f"{case['name']}:{case['regex']}")
+    def test_bytes_match(self, case, search, strings):
+        '''El matcher de bytes en UTF-8 coincide con el de strings sobre las cadenas codificadas'''
+        matcher = case["regex"].compile("table", search=search)
+        byte_matcher = compile_bytes(case["regex"], search=search)
+        encoded = [string.encode() for string in strings]
+        assert [byte_matcher.match(string) for string in encoded] == [matcher.match(string) for string in strings]
+        assert list(byte_matcher.match_many(encoded)) == list(matcher.match_many(strings))
+        assert list(byte_matcher.match_many(iter(encoded))) == list(matcher.match_many(strings))
+
+    @pytest.mark.parametrize("regex, pattern", char_class_cases, ids=lambda case: str(case))
+    def test_bytes_char_class(self, regex, pattern):
+        '''Las clases de caracteres se convierten a intervalos de bytes en UTF-8'''
+        matcher = compile_bytes(regex)
+        searcher = compile_bytes(regex, search=True)
+        for string in char_class_strings:
+            assert matcher.match(string.encode()) == (re.fullmatch(pattern, string) is not None)
+            assert searcher.match(string.encode()) == (re.search(pattern, string) is not None)
+
+    def test_utf8_sequences(self):
+        '''Cada carácter de un intervalo es aceptado por exactamente una secuencia de intervalos de bytes'''
+        assert list(utf8_sequences(0x80, 0x7FF)) == [((0xC2, 0xDF), (0x80, 0xBF))]
+        sequences = list(utf8_sequences(0, 0x10FFFF))
+        for code in list(range(0, 0x3000, 7)) + [0xD7FF, 0xE000, 0xFFFF, 0x10000, 0x10FFFF]:
+            encoded = chr(code).encode()
+            assert sum(len(sequence) == len(encoded) and all(lo <= byte <= hi for byte, (lo, hi) in zip(
+                encoded, sequence)) for sequence in sequences) == 1
+
+    def test_bytes_invalid_utf8(self):
+        '''Las cadenas de bytes que no son UTF-8 válido no producen errores'''
+        # [^a]*a
+        regex = Concat(Star(CharClass(CharSet.of("a").complement())), Char('a'))
+        afd = utf8_afnd(regex.to_afnd()).determinize().minimize()
+        matcher = ByteDFA(afd)
+        assert matcher.match("ñЖ😀a".encode())
+        assert not matcher.match(b"\xff\xfea")
+        assert not matcher.match("ñ".encode()[:1] + b"a")
+        searcher = compile_bytes(regex, search=True)
+        assert searcher.match(b"\xff\xfea")
+        assert not searcher.match(b"\xff\xfe")
+        # [^a]+!: las clases negadas no matchean los bytes inválidos que surrogateescape convierte en surrogates
+        regex = Concat(Plus(CharClass(CharSet.of("a").complement())), Char('!'))
+        line = b"\xff\xfeb!".decode("utf-8", "surrogateescape")
+        assert list(SpanMatcher(regex.to_afnd()).spans(line)) == [(2, 4)]
+
+    def test_prefilter(self):
+        '''El prefiltro rechaza las cadenas sin los literales obligatorios sin ejecutar el matcher'''
+        # ab(c|d)*e(f|g)*ef
+        regex = Concat(Concat(Char('a'), Char('b')), Concat(Star(Union(Char('c'), Char('d'))), Concat(
+            Char('e'), Concat(Star(Union(Char('f'), Char('g'))), Concat(Char('e'), Char('f'))))))
+        literals = regex.literals()
+        assert (literals.prefix, literals.suffix, literals.exact) == ("ab", "ef", None)
+        prefilter = Prefilter(regex, PikeVM(regex.to_afnd()))
+        assert prefilter.match("abcdefgef")
+        assert not prefilter.match("xbcdefgef")
+        assert not prefilter.match("abcdefgex")
+        assert not prefilter.match("abcdefge")
+        assert prefilter.rejects == 3
+
+    def test_prefilter_bounds(self):
+        '''El prefiltro rechaza las cadenas por su largo y su primer y último carácter'''
+        # (a|b)(c|d)?
+        regex = Concat(Union(Char('a'), Char('b')), Union(Union(Char('c'), Char('d')), Lambda()))
+        prefilter = Prefilter(regex, PikeVM(regex.to_afnd()))
+        assert prefilter.match("bd")
+        assert not prefilter.match("")
+        assert not prefilter.match("acd")
+        assert not prefilter.match("cd")
+        assert not prefilter.match("ae")
+        assert prefilter.rejects == 4
+
+    def test_prefilter_deep(self):
+        '''El prefiltro de una concatenación profunda se construye sin recursión'''
+        # a...ab* (con 600 aes)
+        regex = Star(Char('b'))
+        for _ in range(600):
+            regex = Concat(Char('a'), regex)
+        matcher = regex.compile("derivatives")
+        assert isinstance(matcher, Prefilter)
+        assert matcher.match("a" * 600 + "bb")
+        assert not matcher.match("a" * 599 + "bb")
+        assert regex.bounds().min_length == 600
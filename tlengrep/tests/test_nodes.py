@@ -0,0 +1,156 @@
+from automata import CharSet
+from automata.ranges import minterms
+from regex import Empty, Lambda, Char, CharClass, Concat, Union, Star, Plus, Repeat
+
+
+class TestNodes:
+
+    def test_structural_equality(self):
+        '''Las expresiones con la misma estructura son iguales y tienen el mismo hash'''
+        exp1 = Concat(Star(Union(Char('a'), Char('b'))), Plus(Char('c')))
+        exp2 = Concat(Star(Union(Char('a'), Char('b'))), Plus(Char('c')))
+        assert exp1 is not exp2
+        assert exp1 == exp2
+        assert hash(exp1) == hash(exp2)
+        assert len({exp1, exp2}) == 1
+        assert Empty() == Empty()
+        assert Lambda() != Empty()
+
+    def test_structural_inequality(self):
+        '''Las expresiones con distinta estructura son distintas'''
+        assert Char('a') != Char('b')
+        assert Concat(Char('a'), Char('b')) != Concat(Char('b'), Char('a'))
+        assert Concat(Char('a'), Char('b')) != Union(Char('a'), Char('b'))
+        assert Star(Char('a')) != Plus(Char('a'))
+
+    def test_intern(self):
+        '''Cada subexpresión distinta internada existe una única vez'''
+        exp1 = Union(Concat(Char('a'), Char('b')), Concat(Char('a'), Char('b'))).intern()
+        exp2 = Concat(Char('a'), Char('b')).intern()
+        assert exp1.exp1 is exp1.exp2
+        assert exp1.exp1 is exp2
+        assert exp2.exp1 is Char('a').intern()
+
+    def test_simplify_empty_and_lambda(self):
+        '''La simplificación elimina ∅ y λ donde no aportan'''
+        assert Union(Empty(), Char('a')).simplify() == Char('a')
+        assert Union(Char('a'), Empty()).simplify() == Char('a')
+        assert Concat(Empty(), Char('a')).simplify() == Empty()
+        assert Concat(Char('a'), Empty()).simplify() == Empty()
+        assert Concat(Lambda(), Char('a')).simplify() == Char('a')
+        assert Concat(Char('a'), Lambda()).simplify() == Char('a')
+        assert Star(Empty()).simplify() == Lambda()
+        assert Plus(Empty()).simplify() == Empty()
+
+    def test_simplify_closures(self):
+        '''La simplificación colapsa las clausuras anidadas'''
+        assert Star(Star(Char('a'))).simplify() == Star(Char('a'))
+        assert Star(Plus(Char('a'))).simplify() == Star(Char('a'))
+        assert Plus(Star(Char('a'))).simplify() == Star(Char('a'))
+        assert Plus(Plus(Char('a'))).simplify() == Plus(Char('a'))
+
+    def test_simplify_union(self):
+        '''La simplificación ordena las alternativas de las uniones y elimina las repetidas'''
+        exp1 = Union(Char('b'), Union(Char('a'), Char('b'))).simplify()
+        exp2 = Union(Union(Char('a'), Empty()), Char('b')).simplify()
+        assert exp1 == Union(Char('a'), Char('b'))
+        assert exp2 == exp1
+        assert Union(Lambda(), Star(Char('a'))).simplify() == Star(Char('a'))
+
+    def test_simplify_unchanged(self):
+        '''Una expresión que no se puede simplificar se devuelve sin copiarla'''
+        exp = Concat(Star(Union(Char('a'), Char('b'))), Plus(Char('c')))
+        assert exp.simplify() is exp
+
+    def test_simplify_long_union(self):
+        '''La simplificación admite uniones con muchas alternativas'''
+        exp = Char('a')
+        for _ in range(5000):
+            exp = Union(Char('b'), exp)
+        assert exp.simplify() == Union(Char('a'), Char('b'))
+
+    def test_literals(self):
+        '''Se calculan el prefijo, el sufijo y el factor obligatorios'''
+        # (xaby|xabw)z+
+        regex = Concat(Union(Concat(Char('x'), Concat(Char('a'), Concat(Char('b'), Char('y')))),
+                             Concat(Char('x'), Concat(Char('a'), Concat(Char('b'), Char('w'))))),
+                       Plus(Char('z')))
+        literals = regex.literals()
+        assert literals.prefix == "xab"
+        assert literals.suffix == "z"
+        assert literals.factor == "xab"
+        assert literals.exact is None
+        assert Union(Concat(Char('a'), Char('b')), Empty()).literals().exact == "ab"
+        assert Concat(Char('a'), Empty()).literals() is None
+
+    def test_literals_deep(self):
+        '''Los literales de una concatenación profunda se calculan sin recursión'''
+        # a...ab* (con 5000 aes)
+        regex = Star(Char('b'))
+        for _ in range(5000):
+            regex = Concat(Char('a'), regex)
+        assert regex.literals().prefix == "a" * 5000
+        assert regex.literals().exact is None
+
+    def test_bounds(self):
+        '''Se calculan las cotas de largo y los primeros y últimos caracteres'''
+        # (ab|c)*d+
+        regex = Concat(Star(Union(Concat(Char('a'), Char('b')), Char('c'))), Plus(Char('d')))
+        bounds = regex.bounds()
+        assert (bounds.min_length, bounds.max_length) == (1, None)
+        assert bounds.first_chars == {'a', 'c', 'd'}
+        assert bounds.last_chars == {'d'}
+        bounds = Union(Concat(Char('a'), Char('b')), Lambda()).bounds()
+        assert (bounds.min_length, bounds.max_length) == (0, 2)
+        assert Star(Empty()).bounds().max_length == 0
+        assert Concat(Char('a'), Empty()).bounds() is None
+
+    def test_literal_words(self):
+        '''Se reconocen las uniones de palabras'''
+        # ab|c|λ|ab
+        regex = Union(Concat(Char('a'), Char('b')), Union(Char('c'), Union(Lambda(), Concat(Char('a'), Char('b')))))
+        assert regex.literal_words() == ["ab", "c", ""]
+        assert Union(Char('a'), Empty()).literal_words() == ["a"]
+        assert Union(Char('a'), Star(Char('b'))).literal_words() is None
+
+    def test_repeat(self):
+        '''La repetición acotada se simplifica y calcula sus literales y cotas sin copiar la subexpresión'''
+        regex = Repeat(Concat(Char('a'), Char('b')), 2, 3)
+        assert str(regex) == "(ab){2,3}"
+        assert str(Repeat(Char('a'), 2, None)) == "a{2,}"
+        assert str(Repeat(Char('a'), 4, 4)) == "a{4}"
+        assert regex.naive_match("ababab")
+        assert not regex.naive_match("ab")
+        assert Repeat(Char('a'), 0, 0).simplify() == Lambda()
+        assert Repeat(Char('a'), 0, None).simplify() == Star(Char('a'))
+        assert Repeat(Char('a'), 1, None).simplify() == Plus(Char('a'))
+        assert Repeat(Empty(), 1, 2).simplify() == Empty()
+        bounds = regex.bounds()
+        assert (bounds.min_length, bounds.max_length) == (4, 6)
+        assert Repeat(Char('a'), 3, 3).literals().exact == "aaa"
+        assert regex.literals().prefix == "ab"
+
+    def test_char_class(self):
+        '''Las clases de caracteres guardan intervalos disjuntos y ordenados'''
+        regex = CharClass([('x', 'z'), ('a', 'f'), ('d', 'k')])
+        assert regex.chars.ranges == ((ord('a'), ord('k')), (ord('x'), ord('z')))
+        assert str(regex) == "[a-kx-z]"
+        assert regex == CharClass(CharSet([('a', 'k'), ('x', 'z')]))
+        assert regex.naive_match("y") and not regex.naive_match("m") and not regex.naive_match("ab")
+        assert CharClass([]).simplify() == Empty()
+        assert CharClass([('q', 'q')]).simplify() == Char('q')
+        bounds = Concat(regex, Char('1')).bounds()
+        assert 'b' in bounds.first_chars and 'm' not in bounds.first_chars
+        assert bounds.last_chars == {'1'}
+        assert regex.literal_words() is None
+
+    def test_char_set(self):
+        '''Los CharSet se complementan y se parten en mintérminos'''
+        letters = CharSet([('a', 'z')])
+        assert len(letters.complement()) == 0x110000 - 0x800 - 26
+        assert '\ud800' not in letters.complement() and '\udfff' not in letters.complement()
+        assert 'a' not in letters.complement() and '\U0010ffff' in letters.complement()
+        assert CharSet([('c', 'd')]) in letters
+        vowels = CharSet.of("aeiou")
+        assert [symbol for symbol, _ in minterms([letters, vowels, '!'])] == \
+            ['!', vowels, CharSet([('b', 'd'), ('f', 'h'), ('j', 'n'), ('p', 't'), ('v', 'z')])]
@@ -1,43 +1,167 @@
 #!/usr/bin/env python3
 import optparse
+import os
+import stat
 import sys
 import importlib
+from itertools import islice
 
+from engines import CONSTRUCTIONS, ENGINES, compile_bytes, compile_patterns, compile_spans
 from parse_regex import parse_regex, SyntaxError
 
-usage = "%prog [regex] [file]"
+usage = "%prog [regex] [file]\n       %prog -e regex [-e regex ...] [file]\n       %prog -f patterns [file]"
+
+BATCH_SIZE = 4096
+
+# Secuencias ANSI para resaltar las apariciones (--color)
+HIGHLIGHT_START = "\033[01;31m"
+HIGHLIGHT_END = "\033[0m"
 
 opt_parser = optparse.OptionParser(usage=usage)
 opt_parser.add_option("-m", "--module", dest="module", action="store_true",
                       help="read the regular expression from a Python module")
 opt_parser.add_option("-n", "--naive", dest="naive", action="store_true",
                       help="use the naive implementation to match against the regular expression")
+opt_parser.add_option("--engine", dest="engine", choices=list(ENGINES), default="pikevm",
+                      help="matching engine to use: " + ", ".join(ENGINES) + " [default: %default]")
+opt_parser.add_option("--construction", dest="construction", choices=list(CONSTRUCTIONS), default="thompson",
+                      help="AFND construction for the automata engines: " + ", ".join(CONSTRUCTIONS) + " [default: %default]")
+opt_parser.add_option("-e", "--regexp", dest="patterns", action="append",
+                      help="pattern to match (can be repeated); lines are prefixed with the matching patterns")
+opt_parser.add_option("-f", "--file", dest="pattern_file",
+                      help="read the patterns from a file, one per line")
+opt_parser.add_option("-g", "--search", dest="search", action="store_true",
+                      help="print the lines that contain a match anywhere (like grep) instead of whole-line matches")
+opt_parser.add_option("-o", "--only-matching", dest="only_matching", action="store_true",
+                      help="print only the matched parts of the lines, one per line")
+opt_parser.add_option("--color", dest="color", action="store_true",
+                      help="highlight the matched parts of the lines")
+opt_parser.add_option("-U", "--binary", dest="binary", action="store_true",
+                      help="match the lines as UTF-8 bytes, without decoding them (invalid UTF-8 never matches)")
+opt_parser.add_option("-s", "--stats", dest="stats", action="store_true",
+                      help="print the matcher statistics to stderr when done")
 opts, args = opt_parser.parse_args()
 
-if len(args) < 1:
+
+def load_regex(pattern):
+    """Carga una expresión regular desde un módulo (-m) o parseándola."""
+    if opts.module:
+        return importlib.import_module(pattern).__regex__
+    try:
+        return parse_regex(pattern)
+    except SyntaxError as e:
+        print(f"Syntax error: {e}", file=sys.stderr)
+        exit(1)
+
+
+def batch_size(input_file):
+    """
+    Devuelve cuántas líneas se matchean por lote. Solo se agrupan las líneas
+    de un archivo regular: si la entrada es un pipe o una terminal (como con
+    tail -f), cada línea se matchea e imprime apenas llega.
+    """
+    return BATCH_SIZE if stat.S_ISREG(os.fstat(input_file.fileno()).st_mode) else 1
+
+
+def match_patterns(matcher, input_file):
+    """Imprime las líneas que matchean algún patrón, precedidas por los números de esos patrones."""
+    for line in input_file:
+        matched = matcher.matches(line.strip("\n"))
+        if matched:
+            print(",".join(str(pattern + 1) for pattern in matched) + ":" + line, end="")
+
+
+patterns = list(opts.patterns or [])
+if opts.pattern_file is not None:
+    with open(opts.pattern_file) as f:
+        patterns.extend(line.strip("\n") for line in f if line.strip("\n"))
+elif opts.patterns is None and len(args) > 0:
+    patterns.append(args.pop(0))
+
+if len(patterns) < 1:
     opt_parser.print_help()
     exit(1)
-elif len(args) > 2:
+elif len(args) > 1:
     print("ERROR: Too many arguments", file=sys.stderr)
     exit(1)
+elif len(patterns) > 1 and (opts.only_matching or opts.color):
+    print("ERROR: -o and --color need a single pattern", file=sys.stderr)
+    exit(1)
+elif opts.binary and (len(patterns) > 1 or opts.naive):
+    print("ERROR: --binary needs a single pattern and an automata engine", file=sys.stderr)
+    exit(1)
+elif len(patterns) > 1:
+    # Todos los patrones se matchean a la vez sobre un único autómata
+    matcher = compile_patterns([load_regex(pattern) for pattern in patterns], opts.construction, opts.search)
+    with open(args[0]) if len(args) == 1 else sys.stdin as input_file:
+        match_patterns(matcher, input_file)
+
+    if opts.stats:
+        for name, value in matcher.stats().items():
+            print(f"{name}: {value}", file=sys.stderr)
 else:
-    regex_arg = args[0]
-    if opts.module:
-        regex_module = importlib.import_module(regex_arg)
-        regex = regex_module.__regex__
+    regex = load_regex(patterns[0])
+
+    if opts.binary:
+        # Las líneas se leen como bytes y se matchean sin decodificarlas
+        matcher = compile_bytes(regex, opts.construction, opts.search)
+        newline = b"\n"
     else:
-        try:
-            regex = parse_regex(regex_arg)
-        except SyntaxError as e:
-            print(f"Syntax error: {e}", file=sys.stderr)
-            exit(1)
-
-    with open(args[1]) if len(args) == 2 else sys.stdin as input_file:
-        for line in input_file:
-            if opts.naive:
-                matched = regex.naive_match(line.strip("\n"))
-            else:
-                matched = regex.match(line.strip("\n"))
-
-            if matched:
-                print(line, end="")
+        # La implementación naive se usa memoizada: misma semántica, tiempo polinomial
+        matcher = regex.compile("memo" if opts.naive else opts.engine, opts.construction, opts.search)
+        newline = "\n"
+    spanner = compile_spans(regex, opts.construction) if opts.search else None
+
+    def spans(line):
+        """Devuelve las apariciones no vacías del patrón en una línea que matchea."""
+        if spanner is None:
+            return [(0, len(line))]
+        return [(start, end) for start, end in spanner.spans(line) if end > start]
+
+    def output(text):
+        """
+        Imprime una línea de salida. En modo binario se escribe en bytes, y
+        los bytes inválidos de la entrada se reproducen tal cual.
+        """
+        if opts.binary:
+            sys.stdout.buffer.write(text.encode("utf-8", "surrogateescape") + newline)
+        else:
+            print(text)
+
+    # Las líneas de un archivo se matchean en lotes, para pagar el costo fijo de cada llamada una vez por lote
+    if len(args) == 1:
+        input_file = open(args[0], "rb" if opts.binary else "r")
+    else:
+        input_file = sys.stdin.buffer if opts.binary else sys.stdin
+    with input_file:
+        size = batch_size(input_file)
+        while lines := list(islice(input_file, size)):
+            matches = matcher.match_many([line.strip(newline) for line in lines])
+
+            for line, matched in zip(lines, matches):
+                if not matched:
+                    continue
+                if opts.only_matching or opts.color:
+                    stripped = line.strip(newline)
+                    if opts.binary:
+                        # Solo se decodifican las líneas que matchean
+                        stripped = stripped.decode("utf-8", "surrogateescape")
+                    if opts.only_matching:
+                        for start, end in spans(stripped):
+                            output(stripped[start:end])
+                        continue
+                    parts = []
+                    position = 0
+                    for start, end in spans(stripped):
+                        parts.extend([stripped[position:start], HIGHLIGHT_START, stripped[start:end], HIGHLIGHT_END])
+                        position = end
+                    parts.append(stripped[position:])
+                    output("".join(parts))
+                elif opts.binary:
+                    sys.stdout.buffer.write(line)
+                else:
+                    print(line, end="")
+
+    if opts.stats:
+        for name, value in matcher.stats().items():
+            print(f"{name}: {value}", file=sys.stderr)